@@ -12,22 +12,53 @@ down_revision = "5fb47ed06aeb"
 branch_labels = None
 depends_on = None
 
+# Schedule strings fetched per cursor batch and written per bulk UPDATE statement
+BATCH_SIZE = 1000
+
+
+def _bulk_update(conn, batch: list[tuple]) -> None:
+    """Apply a batch of (old, new) schedule pairs with a single UPDATE ... FROM (VALUES ...)."""
+    values = ", ".join(f"(:old{i}, :new{i})" for i in range(len(batch)))
+    params = {}
+    for i, (old, new) in enumerate(batch):
+        params[f"old{i}"] = old
+        params[f"new{i}"] = new
+
+    conn.execute(
+        sa.text(
+            "UPDATE classes SET schedule = v.new "
+            f"FROM (VALUES {values}) AS v(old, new) "
+            "WHERE classes.schedule = v.old"
+        ),
+        params,
+    )
+
 
 def upgrade() -> None:
     from app.services.schedule_parser import ScheduleParserService
 
     conn = op.get_bind()
-    rows = conn.execute(sa.text("SELECT id, schedule FROM classes")).fetchall()
-
-    for row_id, schedule in rows:
-        if not schedule:
-            continue
-        normalized = ScheduleParserService.normalize_schedule(schedule)
-        if normalized != schedule:
-            conn.execute(
-                sa.text("UPDATE classes SET schedule = :schedule WHERE id = :id"),
-                {"schedule": normalized, "id": row_id},
-            )
+    # The same schedule strings repeat across many classes, so only the distinct
+    # non-canonical values are fetched and each is parsed once; every class sharing
+    # a value is rewritten by the same UPDATE. Streaming with a server-side cursor
+    # keeps one batch in memory at a time.
+    result = conn.execution_options(stream_results=True, yield_per=BATCH_SIZE).execute(
+        sa.text(
+            "SELECT DISTINCT schedule FROM classes "
+            "WHERE schedule IS NOT NULL AND schedule <> '' AND schedule !~ :canonical"
+        ),
+        {"canonical": ScheduleParserService.CANONICAL_RE.pattern},
+    )
+
+    for rows in result.partitions():
+        updates = []
+        for (schedule,) in rows:
+            normalized = ScheduleParserService.normalize_schedule(schedule)
+            if normalized != schedule:
+                updates.append((schedule, normalized))
+
+        if updates:
+            _bulk_update(conn, updates)
 
 
 def downgrade() -> None:
@@ -0,0 +1,53 @@
+"""normalize and index registration email
+
+Revision ID: 088e8f746d4f
+Revises: 9965473bd594
+Create Date: 2026-10-16 13:05:12.418230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '088e8f746d4f'
+down_revision: Union[str, Sequence[str], None] = '9965473bd594'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Emails are stored lower-cased from now on, so a plain btree index serves
+    # case-insensitive lookups without wrapping the column in lower()
+    for table in ('registrations', 'contact_inquiries'):
+        op.execute(
+            sa.text(
+                f"UPDATE {table} SET email = lower(trim(email)) "
+                "WHERE email <> lower(trim(email))"
+            )
+        )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_registrations_email',
+            'registrations',
+            ['email'],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Lower-casing is not reversed; only the index is dropped
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_registrations_email',
+            table_name='registrations',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
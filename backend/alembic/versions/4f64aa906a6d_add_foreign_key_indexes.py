@@ -0,0 +1,55 @@
+"""add foreign key indexes
+
+Revision ID: 4f64aa906a6d
+Revises: 268f5619f962
+Create Date: 2026-10-16 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f64aa906a6d'
+down_revision: Union[str, Sequence[str], None] = '268f5619f962'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) pairs for foreign keys that were created without an index
+FOREIGN_KEY_COLUMNS = [
+    ('classes', 'teacher_id'),
+    ('classes', 'yoga_type_id'),
+    ('registrations', 'class_id'),
+    ('registrations', 'session_id'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, and avoids
+    # blocking writes to these tables while the indexes are built
+    with op.get_context().autocommit_block():
+        for table, column in FOREIGN_KEY_COLUMNS:
+            op.create_index(
+                op.f(f'ix_{table}_{column}'),
+                table,
+                [column],
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table, column in reversed(FOREIGN_KEY_COLUMNS):
+            op.drop_index(
+                op.f(f'ix_{table}_{column}'),
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,59 @@
+"""index registrations by created_at and id
+
+Revision ID: 5e0b7c2d9a41
+Revises: c11dab27fccf
+Create Date: 2026-10-16 14:48:21.306117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e0b7c2d9a41'
+down_revision: Union[str, Sequence[str], None] = 'c11dab27fccf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The admin registration list pages on (created_at, id) and the dashboard reads
+    # the newest rows; one composite index serves both as a backward range scan and
+    # replaces the single-column created_at index.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_registrations_created_at_id',
+            'registrations',
+            ['created_at', 'id'],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_registrations_created_at',
+            table_name='registrations',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_registrations_created_at',
+            'registrations',
+            ['created_at'],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_registrations_created_at_id',
+            table_name='registrations',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
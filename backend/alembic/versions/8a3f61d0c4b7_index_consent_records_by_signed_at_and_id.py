@@ -0,0 +1,43 @@
+"""index consent records by signed_at and id
+
+Revision ID: 8a3f61d0c4b7
+Revises: 5e0b7c2d9a41
+Create Date: 2026-10-16 16:02:37.518904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a3f61d0c4b7'
+down_revision: Union[str, Sequence[str], None] = '5e0b7c2d9a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The admin consent list is ordered and keyset-paged on (signed_at, id)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_consent_records_signed_at_id',
+            'consent_records',
+            ['signed_at', 'id'],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_consent_records_signed_at_id',
+            table_name='consent_records',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
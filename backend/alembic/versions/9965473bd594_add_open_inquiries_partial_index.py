@@ -0,0 +1,44 @@
+"""add open inquiries partial index
+
+Revision ID: 9965473bd594
+Revises: c7123ef64256
+Create Date: 2026-10-16 12:20:33.104871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9965473bd594'
+down_revision: Union[str, Sequence[str], None] = 'c7123ef64256'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The admin inquiry queue lists open inquiries newest first; only open rows are indexed
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contact_inquiries_open',
+            'contact_inquiries',
+            ['created_at'],
+            unique=False,
+            if_not_exists=True,
+            postgresql_where=sa.text("status = 'open'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_contact_inquiries_open',
+            table_name='contact_inquiries',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
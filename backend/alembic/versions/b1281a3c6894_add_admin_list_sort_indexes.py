@@ -0,0 +1,55 @@
+"""add admin list sort indexes
+
+Revision ID: b1281a3c6894
+Revises: b992cd13cea3
+Create Date: 2026-10-16 10:41:05.227816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b1281a3c6894'
+down_revision: Union[str, Sequence[str], None] = 'b992cd13cea3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns) backing the admin lists ordered by created_at,
+# optionally filtered by status
+SORT_INDEXES = [
+    ('ix_registrations_created_at', 'registrations', ['created_at']),
+    ('ix_registrations_status_created_at', 'registrations', ['status', 'created_at']),
+    ('ix_payments_created_at', 'payments', ['created_at']),
+    ('ix_payments_status_created_at', 'payments', ['status', 'created_at']),
+    ('ix_contact_inquiries_created_at', 'contact_inquiries', ['created_at']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in SORT_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(SORT_INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
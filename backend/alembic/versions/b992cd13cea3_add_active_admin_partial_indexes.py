@@ -0,0 +1,43 @@
+"""add active admin partial indexes
+
+Revision ID: b992cd13cea3
+Revises: 4f64aa906a6d
+Create Date: 2026-10-16 10:02:17.540913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b992cd13cea3'
+down_revision: Union[str, Sequence[str], None] = '4f64aa906a6d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Login looks admins up by username and auth by id, both filtered on is_active
+    op.create_index(
+        'ix_admin_users_username_active',
+        'admin_users',
+        ['username'],
+        unique=True,
+        postgresql_where=sa.text('is_active'),
+    )
+    op.create_index(
+        'ix_admin_users_id_active',
+        'admin_users',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_admin_users_id_active', table_name='admin_users')
+    op.drop_index('ix_admin_users_username_active', table_name='admin_users')
@@ -0,0 +1,56 @@
+"""store class schedule_data as jsonb
+
+Revision ID: c11dab27fccf
+Revises: 87027d27440e
+Create Date: 2026-10-16 14:02:38.517904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c11dab27fccf'
+down_revision: Union[str, Sequence[str], None] = '87027d27440e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows holding text that is not valid JSON become NULL instead of failing the
+    # cast; the application re-parses the schedule string for those on next use.
+    op.execute(
+        """
+        CREATE FUNCTION pg_temp.try_jsonb(value text) RETURNS jsonb AS $$
+        BEGIN
+            RETURN value::jsonb;
+        EXCEPTION WHEN others THEN
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.alter_column(
+        'classes',
+        'schedule_data',
+        existing_type=sa.Text(),
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=True,
+        postgresql_using='pg_temp.try_jsonb(schedule_data)',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'classes',
+        'schedule_data',
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        type_=sa.Text(),
+        existing_nullable=True,
+        postgresql_using='schedule_data::text',
+    )
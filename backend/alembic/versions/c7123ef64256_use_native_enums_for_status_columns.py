@@ -0,0 +1,76 @@
+"""use native enums for status columns
+
+Revision ID: c7123ef64256
+Revises: fd9ebd60e192
+Create Date: 2026-10-16 11:48:20.671502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7123ef64256'
+down_revision: Union[str, Sequence[str], None] = 'fd9ebd60e192'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, enum type, server default) for columns whose values are only
+# ever set by the application
+ENUM_COLUMNS = [
+    ('registrations', 'status',
+     postgresql.ENUM('confirmed', 'waitlist', 'cancelled', 'pending_payment', name='registration_status', create_type=False),
+     'confirmed'),
+    ('payments', 'status',
+     postgresql.ENUM('pending', 'confirmed', 'cancelled', 'refunded', name='payment_status', create_type=False),
+     None),
+    ('payments', 'payment_type',
+     postgresql.ENUM('single_session', 'package', name='payment_type', create_type=False),
+     None),
+    ('inquiry_replies', 'email_status',
+     postgresql.ENUM('pending', 'sent', 'failed', name='email_status', create_type=False),
+     None),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    for table, column, enum_type, server_default in ENUM_COLUMNS:
+        enum_type.create(bind, checkfirst=True)
+        # A VARCHAR default cannot be cast automatically, so swap it around the type change
+        if server_default is not None:
+            op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=enum_type,
+            existing_type=sa.String(length=50),
+            existing_nullable=False,
+            postgresql_using=f'{column}::{enum_type.name}',
+        )
+        if server_default is not None:
+            op.alter_column(table, column, server_default=server_default)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    for table, column, enum_type, server_default in reversed(ENUM_COLUMNS):
+        if server_default is not None:
+            op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=50),
+            existing_type=enum_type,
+            existing_nullable=False,
+            postgresql_using=f'{column}::text',
+        )
+        if server_default is not None:
+            op.alter_column(table, column, server_default=server_default)
+        enum_type.drop(bind, checkfirst=True)
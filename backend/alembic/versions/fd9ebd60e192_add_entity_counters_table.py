@@ -0,0 +1,47 @@
+"""add entity counters table
+
+Revision ID: fd9ebd60e192
+Revises: b1281a3c6894
+Create Date: 2026-10-16 11:05:48.913370
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fd9ebd60e192'
+down_revision: Union[str, Sequence[str], None] = 'b1281a3c6894'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Counter name -> table whose rows it counts
+COUNTED_TABLES = {
+    'registrations': 'registrations',
+    'teachers': 'teachers',
+    'classes': 'classes',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'entity_counters',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('value', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+    # Seed from the current row counts; the ORM keeps them current from here on
+    for name, table in COUNTED_TABLES.items():
+        op.execute(
+            f"INSERT INTO entity_counters (name, value) SELECT '{name}', COUNT(*) FROM {table}"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('entity_counters')
@@ -1,15 +1,22 @@
-from datetime import datetime, timedelta, timezone
+import asyncio
+import base64
+from collections import OrderedDict
+from datetime import timedelta
 from typing import Optional
+import time
 import uuid
 
 from fastapi import Depends, HTTPException, status, Request, Cookie
 from fastapi.security import HTTPBearer
 from fastapi.security.utils import get_authorization_scheme_param
 import jwt
-from jwt.exceptions import PyJWTError
+from jwt.exceptions import DecodeError, PyJWTError
+import orjson
 import hashlib
+import hmac
+import bcrypt
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
 
 from app.config import settings
 from app.database import get_db
@@ -17,26 +24,145 @@ from app.models.admin_user import AdminUser
 
 security = HTTPBearer()
 
+# JWT and hashing settings are resolved once instead of per request
+_JWT_KEY = settings.jwt_secret_key.encode()
+_JWT_ALGORITHM = settings.jwt_algorithm
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+_JWT_EXPIRE_SECONDS = settings.jwt_access_token_expire_minutes * 60
+_PASSWORD_HASH_ROUNDS = settings.password_hash_rounds
+
+
+class _OrjsonJWT(jwt.PyJWT):
+    """PyJWT decoder that parses the claims payload with orjson.
+
+    Signature verification and claim checks are still done by PyJWT.
+    """
+
+    def _decode_payload(self, decoded: dict) -> dict:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except (orjson.JSONDecodeError, RecursionError) as e:
+            raise DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt_decoder = _OrjsonJWT()
+
+# Built once so the hot auth path reuses the same statement (and its cached compilation)
+_ACTIVE_ADMIN_BY_ID = select(AdminUser).where(
+    AdminUser.id == bindparam("admin_id"), AdminUser.is_active.is_(True)
+)
+
+_CREDENTIALS_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+
+def _credentials_exception() -> HTTPException:
+    # Built only on the failure path; a fresh instance per raise keeps tracebacks
+    # from accumulating on a shared exception object across requests.
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers=_CREDENTIALS_HEADERS,
+    )
+
+
+# Short-lived cache of resolved admins, keyed by a digest of the JWT so raw
+# tokens are never kept in memory. Entries expire after the TTL or when the
+# token itself expires, whichever comes first.
+ADMIN_CACHE_TTL_SECONDS = 30
+ADMIN_CACHE_MAX_SIZE = 10_000
+_admin_cache: "OrderedDict[bytes, tuple[float, AdminUser]]" = OrderedDict()
+
+
+def _admin_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _get_cached_admin(key: bytes) -> Optional[AdminUser]:
+    entry = _admin_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, admin = entry
+    if expires_at <= time.time():
+        del _admin_cache[key]
+        return None
+    _admin_cache.move_to_end(key)
+    return admin
+
+
+def _cache_admin(key: bytes, admin: AdminUser, token_exp: Optional[float]) -> None:
+    expires_at = time.time() + ADMIN_CACHE_TTL_SECONDS
+    if token_exp is not None:
+        expires_at = min(expires_at, token_exp)
+
+    # Store a transient copy so the cached object is not bound to the request's session
+    snapshot = AdminUser(**{c.key: getattr(admin, c.key) for c in AdminUser.__table__.columns})
+    _admin_cache[key] = (expires_at, snapshot)
+    _admin_cache.move_to_end(key)
+    while len(_admin_cache) > ADMIN_CACHE_MAX_SIZE:
+        _admin_cache.popitem(last=False)
+
+
+def clear_admin_cache() -> None:
+    """Drop all cached admin lookups."""
+    _admin_cache.clear()
+
+
+def encode_admin_subject(admin_id: uuid.UUID) -> str:
+    """Encode an admin id as the compact JWT subject (unpadded base64url of the 16 UUID bytes)."""
+    return base64.urlsafe_b64encode(admin_id.bytes).rstrip(b"=").decode()
+
+
+def _decode_admin_subject(subject: str) -> uuid.UUID:
+    """Decode a JWT subject back to the admin id.
+
+    Accepts both the compact 22-char form and the 36-char string form issued
+    by older tokens. Raises ValueError for anything else.
+    """
+    if len(subject) == 22:
+        return uuid.UUID(bytes=base64.urlsafe_b64decode(subject + "=="))
+    return uuid.UUID(subject)
+
+
+def _is_legacy_hash(hashed_password: str) -> bool:
+    """Legacy admin hashes are unsalted SHA-256 hex digests rather than bcrypt strings."""
+    return not hashed_password.startswith("$2")
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    # Temporary simple hash verification - TODO: Fix bcrypt integration
-    simple_hash = hashlib.sha256(plain_password.encode()).hexdigest()
-    return simple_hash == hashed_password
+    if _is_legacy_hash(hashed_password):
+        try:
+            expected = bytes.fromhex(hashed_password)
+        except ValueError:
+            return False
+        # Compare raw digests in constant time to avoid leaking timing information
+        return hmac.compare_digest(hashlib.sha256(plain_password.encode()).digest(), expected)
+
+    try:
+        return bcrypt.checkpw(plain_password.encode()[:72], hashed_password.encode())
+    except ValueError:
+        return False
 
 
 def get_password_hash(password: str) -> str:
-    # Temporary simple hash - TODO: Fix bcrypt integration
-    return hashlib.sha256(password.encode()).hexdigest()
+    # bcrypt only uses the first 72 bytes of the password
+    salt = bcrypt.gensalt(rounds=_PASSWORD_HASH_ROUNDS)
+    return bcrypt.hashpw(password.encode()[:72], salt).decode()
 
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-    to_encode = data.copy()
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None, *, _copy: bool = True):
+    # Callers passing a throwaway dict can skip the defensive copy with _copy=False
+    to_encode = data.copy() if _copy else data
+    # JWT "exp" is a NumericDate, so compute the epoch seconds directly
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire_seconds = int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.jwt_access_token_expire_minutes)
+        expire_seconds = _JWT_EXPIRE_SECONDS
 
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)  # type: ignore[arg-type]
+    to_encode["exp"] = int(time.time()) + expire_seconds
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=_JWT_ALGORITHM)
     return encoded_jwt
 
 
@@ -47,89 +173,75 @@ async def authenticate_admin(db: AsyncSession, username: str, password: str) ->
 
     if not admin:
         return None
-    if not verify_password(password, admin.hashed_password):
+    # bcrypt is deliberately slow, so hash work runs in a worker thread rather
+    # than stalling every other request on the event loop
+    if not await asyncio.to_thread(verify_password, password, admin.hashed_password):
         return None
-    return admin
 
+    # Upgrade legacy SHA-256 hashes to bcrypt on the first successful login
+    if _is_legacy_hash(admin.hashed_password):
+        admin.hashed_password = await asyncio.to_thread(get_password_hash, password)
+        await db.commit()
+    return admin
 
-async def get_current_admin_bearer(token = Depends(security), db: AsyncSession = Depends(get_db)) -> AdminUser:
-    """Legacy bearer token authentication - kept for backward compatibility"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
 
+def _decode_token(token: str) -> tuple[uuid.UUID, Optional[int]]:
+    """Validate a JWT and return the admin id from its subject along with its expiry."""
     try:
-        # Handle both string tokens (for testing) and HTTPBearer tokens (for production)
-        token_str = token.credentials if hasattr(token, 'credentials') else token
-        payload = jwt.decode(token_str, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        admin_id_str: str = payload.get("sub")
-        if admin_id_str is None:
-            raise credentials_exception
-
-        # Convert string ID to UUID for database query
-        try:
-            admin_id = uuid.UUID(admin_id_str)
-        except ValueError:
-            raise credentials_exception
+        payload = _jwt_decoder.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
     except PyJWTError:
-        raise credentials_exception
+        raise _credentials_exception()
+
+    admin_id_str: str = payload.get("sub")
+    if admin_id_str is None:
+        raise _credentials_exception()
+    try:
+        admin_id = _decode_admin_subject(admin_id_str)
+    except ValueError:
+        raise _credentials_exception()
+    return admin_id, payload.get("exp")
 
-    query = select(AdminUser).where(AdminUser.id == admin_id, AdminUser.is_active == True)
-    result = await db.execute(query)
-    admin = result.scalar_one_or_none()
 
+async def _load_admin(db: AsyncSession, admin_id: uuid.UUID) -> AdminUser:
+    """Fetch an active admin by id or fail with 401."""
+    result = await db.execute(_ACTIVE_ADMIN_BY_ID, {"admin_id": admin_id})
+    admin = result.scalar_one_or_none()
     if admin is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return admin
 
 
+async def get_current_admin_bearer(token = Depends(security), db: AsyncSession = Depends(get_db)) -> AdminUser:
+    """Legacy bearer token authentication - kept for backward compatibility"""
+    # Handle both string tokens (for testing) and HTTPBearer tokens (for production)
+    token_str = token.credentials if hasattr(token, 'credentials') else token
+    admin_id, _ = _decode_token(token_str)
+    return await _load_admin(db, admin_id)
+
+
 async def get_current_admin(
     request: Request,
     admin_session: str = Cookie(None, alias="admin_session"),
     db: AsyncSession = Depends(get_db)
 ) -> AdminUser:
     """Hybrid authentication supporting both session cookies and Bearer tokens"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
-    # Try session cookie authentication first
-    jwt_token = None
-    if admin_session:
-        jwt_token = admin_session
-    else:
-        # Fallback to Bearer token authentication
+    # Session cookie is the common browser path; only look at headers without it
+    jwt_token = admin_session
+    if not jwt_token:
         authorization = request.headers.get("authorization")
         if authorization:
             scheme, token = get_authorization_scheme_param(authorization)
             if scheme.lower() == "bearer":
                 jwt_token = token
+        if not jwt_token:
+            raise _credentials_exception()
 
-    if not jwt_token:
-        raise credentials_exception
-
-    try:
-        payload = jwt.decode(jwt_token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        admin_id_str: str = payload.get("sub")
-        if admin_id_str is None:
-            raise credentials_exception
+    cache_key = _admin_cache_key(jwt_token)
+    cached_admin = _get_cached_admin(cache_key)
+    if cached_admin is not None:
+        return cached_admin
 
-        # Convert string ID to UUID for database query
-        try:
-            admin_id = uuid.UUID(admin_id_str)
-        except ValueError:
-            raise credentials_exception
-    except PyJWTError:
-        raise credentials_exception
-
-    query = select(AdminUser).where(AdminUser.id == admin_id, AdminUser.is_active == True)
-    result = await db.execute(query)
-    admin = result.scalar_one_or_none()
-
-    if admin is None:
-        raise credentials_exception
-    return admin
\ No newline at end of file
+    admin_id, token_exp = _decode_token(jwt_token)
+    admin = await _load_admin(db, admin_id)
+    _cache_admin(cache_key, admin, token_exp)
+    return admin
@@ -0,0 +1,107 @@
+import hashlib
+import time
+from typing import Any, Hashable
+
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+# Every cache created in this process, so tests can reset them all at once
+_caches: list["TTLCache"] = []
+
+# Session.info key holding the caches a session's open transaction has written to
+_PENDING_CLEARS = "ttl_caches_to_clear"
+
+
+class TTLCache:
+    """In-process cache whose entries expire a fixed number of seconds after being set.
+
+    Nothing is shared between worker processes, so a write only invalidates the
+    cache of the process that committed it; other workers catch up within the TTL.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._watched: set[type] = set()
+        _caches.append(self)
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def clear_on_write(self, *models) -> None:
+        """Drop every entry once a transaction that wrote a row of one of `models` commits.
+
+        Writes are noted on the session as they are flushed, and for ORM-enabled
+        insert()/update()/delete() statements, which bypass the mapper flush events,
+        as they are executed. The entries are only dropped after the commit, so a
+        concurrent request cannot cache the old committed rows again in between; a
+        rollback discards the note.
+        """
+        if not self._watched:
+            event.listen(Session, "do_orm_execute", self._note_statement)
+        self._watched.update(models)
+        for model in models:
+            for event_name in ("after_insert", "after_update", "after_delete"):
+                event.listen(model, event_name, self._note_flush)
+
+    def _note_flush(self, mapper, connection, target) -> None:
+        session = object_session(target)
+        if session is not None:
+            session.info.setdefault(_PENDING_CLEARS, set()).add(self)
+
+    def _note_statement(self, orm_execute_state) -> None:
+        if orm_execute_state.is_select:
+            return
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and mapper.class_ in self._watched:
+            orm_execute_state.session.info.setdefault(_PENDING_CLEARS, set()).add(self)
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_committed_writes(session: Session) -> None:
+    for cache in session.info.pop(_PENDING_CLEARS, ()):
+        cache.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_writes(session: Session) -> None:
+    session.info.pop(_PENDING_CLEARS, None)
+
+
+def clear_all_caches() -> None:
+    """Empty every TTLCache in the process."""
+    for cache in _caches:
+        cache.clear()
+
+
+def etag_for(body: bytes) -> str:
+    """Weak ETag for a serialized response body."""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def conditional_json_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    headers: dict | None = None,
+    cache_control: str = "private, no-cache",
+) -> Response:
+    """Return a serialized JSON body, or an empty 304 if the client already holds this ETag.
+
+    The default `no-cache` lets browsers keep the body but makes them revalidate
+    on every request, so they never hold a copy older than this process's cache.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control, **(headers or {})}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,8 +1,28 @@
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import settings
 
-engine = create_async_engine(settings.database_url, echo=False)
+
+def _engine_options() -> dict:
+    """Driver-specific engine options."""
+    if make_url(settings.database_url).get_driver_name() == "asyncpg":
+        # Keep more server-side prepared statements per connection so hot queries
+        # are parsed/planned once and then executed in a single round-trip
+        return {
+            "connect_args": {"prepared_statement_cache_size": settings.db_prepared_statement_cache_size},
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+        }
+    return {}
+
+
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    query_cache_size=settings.db_query_cache_size,
+    **_engine_options(),
+)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -4,6 +4,7 @@ from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
 from app.config import settings
+from app.uploads import TEACHER_PHOTO_DIR, UploadSizeLimitMiddleware
 from app.routers import classes, teachers, yoga_types, registrations, admin, contact, payments, consent, tracking
 
 app = FastAPI(title="enjoyyoga API")
@@ -11,16 +12,20 @@ app = FastAPI(title="enjoyyoga API")
 # Create uploads directory if it doesn't exist
 uploads_dir = Path("uploads")
 uploads_dir.mkdir(exist_ok=True)
+TEACHER_PHOTO_DIR.mkdir(parents=True, exist_ok=True)
 
 # Mount static files for uploaded content
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
+# Added first so the CORS middleware wraps its 413 responses
+app.add_middleware(UploadSizeLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.include_router(classes.router)
@@ -12,5 +12,6 @@ from app.models.payment import Payment
 from app.models.payment_settings import PaymentSettings
 from app.models.consent_record import ConsentRecord
 from app.models.tracking_token import TrackingToken
+from app.models.entity_counter import EntityCounter
 
-__all__ = ["YogaType", "Teacher", "YogaClass", "Registration", "ClassSession", "AdminUser", "NotificationTemplate", "ContactInquiry", "InquiryReply", "ClassPackage", "Payment", "PaymentSettings", "ConsentRecord", "TrackingToken"]
+__all__ = ["YogaType", "Teacher", "YogaClass", "Registration", "ClassSession", "AdminUser", "NotificationTemplate", "ContactInquiry", "InquiryReply", "ClassPackage", "Payment", "PaymentSettings", "ConsentRecord", "TrackingToken", "EntityCounter"]
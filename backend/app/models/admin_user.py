@@ -1,16 +1,21 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, DateTime, func, Boolean
+from sqlalchemy import String, DateTime, func, Boolean, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.models.ids import uuid7
 from app.models.yoga_type import Base
 
 
 class AdminUser(Base):
     __tablename__ = "admin_users"
+    __table_args__ = (
+        Index("ix_admin_users_username_active", "username", unique=True, postgresql_where=text("is_active")),
+        Index("ix_admin_users_id_active", "id", postgresql_where=text("is_active")),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     username: Mapped[str] = mapped_column(String(100), unique=True)
     email: Mapped[str] = mapped_column(String(300), unique=True)
     hashed_password: Mapped[str] = mapped_column(String(255))
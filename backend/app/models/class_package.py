@@ -4,13 +4,14 @@ from datetime import datetime
 from sqlalchemy import String, Text, Integer, Numeric, Boolean, DateTime, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.models.ids import uuid7
 from app.models.yoga_type import Base
 
 
 class ClassPackage(Base):
     __tablename__ = "class_packages"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     class_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("classes.id"))
     name_en: Mapped[str] = mapped_column(String(200))
     name_zh: Mapped[str] = mapped_column(String(200))
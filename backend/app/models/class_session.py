@@ -4,6 +4,7 @@ from datetime import datetime
 from sqlalchemy import String, Integer, DateTime, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.models.ids import uuid7
 from app.models.yoga_type import Base
 
 
@@ -14,7 +15,7 @@ class ClassSession(Base):
     """
     __tablename__ = "class_sessions"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     class_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("classes.id"))
     start_time: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     end_time: Mapped[datetime] = mapped_column(DateTime(timezone=True))
@@ -1,9 +1,10 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, DateTime, ForeignKey, UniqueConstraint, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, DateTime, ForeignKey, Index, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
+from app.models.ids import uuid7
 from app.models.yoga_type import Base
 
 
@@ -11,9 +12,10 @@ class ConsentRecord(Base):
     __tablename__ = "consent_records"
     __table_args__ = (
         UniqueConstraint("email", "yoga_type_id", name="uq_consent_email_yoga_type"),
+        Index("ix_consent_records_signed_at_id", "signed_at", "id"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     email: Mapped[str] = mapped_column(String(300), index=True)
     name: Mapped[str] = mapped_column(String(200))
     yoga_type_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("yoga_types.id"))
@@ -24,3 +26,7 @@ class ConsentRecord(Base):
 
     # Relationships
     yoga_type: Mapped["YogaType"] = relationship()
+
+    @validates("email")
+    def _normalize_email(self, key: str, email: str) -> str:
+        return email.strip().lower()
@@ -1,16 +1,22 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Text, DateTime, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Text, DateTime, FetchedValue, func, Index, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
+from app.models.ids import uuid7
 from app.models.yoga_type import Base
 
 
 class ContactInquiry(Base):
     __tablename__ = "contact_inquiries"
+    __table_args__ = (
+        Index("ix_contact_inquiries_open", "created_at", postgresql_where=text("status = 'open'")),
+    )
+    # Read the trigger-maintained updated_at back with RETURNING on UPDATE
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(200))
     email: Mapped[str] = mapped_column(String(300))
     phone: Mapped[str | None] = mapped_column(String(50), nullable=True)
@@ -20,8 +26,12 @@ class ContactInquiry(Base):
     status: Mapped[str] = mapped_column(String(50), default="open")  # "open", "in_progress", "resolved", "closed"
     preferred_language: Mapped[str] = mapped_column(String(5), default="en")  # "en" or "zh"
     admin_notes: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
 
     # Relationships
-    replies: Mapped[list["InquiryReply"]] = relationship(back_populates="inquiry")
\ No newline at end of file
+    replies: Mapped[list["InquiryReply"]] = relationship(back_populates="inquiry")
+
+    @validates("email")
+    def _normalize_email(self, key: str, email: str) -> str:
+        return email.strip().lower()
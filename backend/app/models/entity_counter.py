@@ -0,0 +1,48 @@
+from sqlalchemy import BigInteger, String, event, update
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.registration import Registration
+from app.models.teacher import Teacher
+from app.models.yoga_class import YogaClass
+from app.models.yoga_type import Base
+
+
+class EntityCounter(Base):
+    """Row counts kept up to date on insert/delete so the dashboard avoids COUNT(*) scans."""
+    __tablename__ = "entity_counters"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, default=0)
+
+
+# Counter name -> model whose rows it counts
+COUNTED_MODELS = {
+    "registrations": Registration,
+    "teachers": Teacher,
+    "classes": YogaClass,
+}
+
+
+def _adjust_counter(connection, name: str, delta: int) -> None:
+    # Counters are seeded by migration; a missing row is left alone and readers
+    # fall back to COUNT(*) for it
+    counters = EntityCounter.__table__
+    connection.execute(
+        update(counters)
+        .where(counters.c.name == name)
+        .values(value=counters.c.value + delta)
+    )
+
+
+def _register_counter_events(name: str, model) -> None:
+    @event.listens_for(model, "after_insert")
+    def _after_insert(mapper, connection, target):
+        _adjust_counter(connection, name, 1)
+
+    @event.listens_for(model, "after_delete")
+    def _after_delete(mapper, connection, target):
+        _adjust_counter(connection, name, -1)
+
+
+for _name, _model in COUNTED_MODELS.items():
+    _register_counter_events(_name, _model)
@@ -1,21 +1,24 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Text, DateTime, ForeignKey, func
+from sqlalchemy import String, Text, DateTime, ForeignKey, func, Enum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.models.ids import uuid7
 from app.models.yoga_type import Base
 
+EMAIL_STATUSES = ("pending", "sent", "failed")
+
 
 class InquiryReply(Base):
     __tablename__ = "inquiry_replies"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     inquiry_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("contact_inquiries.id"))
     admin_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("admin_users.id"))
     subject: Mapped[str] = mapped_column(String(500))
     message: Mapped[str] = mapped_column(Text)
-    email_status: Mapped[str] = mapped_column(String(50), default="pending")  # "pending", "sent", "failed"
+    email_status: Mapped[str] = mapped_column(Enum(*EMAIL_STATUSES, name="email_status"), default="pending")
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
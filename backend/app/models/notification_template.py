@@ -4,13 +4,14 @@ from datetime import datetime
 from sqlalchemy import String, Text, DateTime, func, Boolean
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.models.ids import uuid7
 from app.models.yoga_type import Base
 
 
 class NotificationTemplate(Base):
     __tablename__ = "notification_templates"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     template_type: Mapped[str] = mapped_column(String(50))  # registration_confirmation, reminder_24h
     channel: Mapped[str] = mapped_column(String(20))  # email, sms
     subject_en: Mapped[str] = mapped_column(String(200))
@@ -1,20 +1,23 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Text, DateTime, func
+from sqlalchemy import String, Text, DateTime, FetchedValue, func
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.models.ids import uuid7
 from app.models.yoga_type import Base
 
 
 class PaymentSettings(Base):
     __tablename__ = "payment_settings"
+    # Read the trigger-maintained updated_at back with RETURNING on UPDATE
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     wechat_qr_code_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     payment_instructions_en: Mapped[str | None] = mapped_column(Text, nullable=True)
     payment_instructions_zh: Mapped[str | None] = mapped_column(Text, nullable=True)
     venmo_qr_code_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     venmo_payment_instructions_en: Mapped[str | None] = mapped_column(Text, nullable=True)
     venmo_payment_instructions_zh: Mapped[str | None] = mapped_column(Text, nullable=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
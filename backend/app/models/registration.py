@@ -1,19 +1,27 @@
 import uuid
 from datetime import datetime, date, time
 
-from sqlalchemy import String, Text, DateTime, Date, Time, ForeignKey, func, Boolean
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Text, DateTime, Date, Time, ForeignKey, func, Boolean, Index, Enum
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
+from app.models.ids import uuid7
 from app.models.yoga_type import Base
 
+REGISTRATION_STATUSES = ("confirmed", "waitlist", "cancelled", "pending_payment")
+
 
 class Registration(Base):
     __tablename__ = "registrations"
-
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    class_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("classes.id"))
+    __table_args__ = (
+        Index("ix_registrations_status_created_at", "status", "created_at"),
+        # Matches the (created_at, id) keyset ordering of the admin list and dashboard
+        Index("ix_registrations_created_at_id", "created_at", "id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    class_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("classes.id"), index=True)
     name: Mapped[str] = mapped_column(String(200))
-    email: Mapped[str] = mapped_column(String(300))
+    email: Mapped[str] = mapped_column(String(300), index=True)
     phone: Mapped[str | None] = mapped_column(String(50), nullable=True)
     message: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -21,8 +29,8 @@ class Registration(Base):
     # NEW FIELDS for schedule integration
     target_date: Mapped[date | None] = mapped_column(Date, nullable=True)  # When user wants to attend
     target_time: Mapped[time | None] = mapped_column(Time, nullable=True)  # Specific time slot
-    session_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("class_sessions.id"), nullable=True)  # Future session reference
-    status: Mapped[str] = mapped_column(String(50), default="confirmed")  # confirmed, waitlist, cancelled
+    session_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("class_sessions.id"), nullable=True, index=True)  # Future session reference
+    status: Mapped[str] = mapped_column(Enum(*REGISTRATION_STATUSES, name="registration_status"), default="confirmed")
 
     # NEW FIELDS for notifications
     email_confirmation_sent: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -33,3 +41,7 @@ class Registration(Base):
 
     yoga_class: Mapped["YogaClass"] = relationship(back_populates="registrations")
     payment: Mapped["Payment"] = relationship(back_populates="registration", uselist=False, lazy="selectin")
+
+    @validates("email")
+    def _normalize_email(self, key: str, email: str) -> str:
+        return email.strip().lower()
@@ -1,22 +1,24 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Text, Integer, Numeric, DateTime, ForeignKey, func, Boolean
+from sqlalchemy import JSON, String, Text, Integer, Numeric, DateTime, ForeignKey, func, Boolean
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.models.ids import uuid7
 from app.models.yoga_type import Base
 
 
 class YogaClass(Base):
     __tablename__ = "classes"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     name_en: Mapped[str] = mapped_column(String(200))
     name_zh: Mapped[str] = mapped_column(String(200))
     description_en: Mapped[str] = mapped_column(Text, default="")
     description_zh: Mapped[str] = mapped_column(Text, default="")
-    teacher_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("teachers.id"))
-    yoga_type_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("yoga_types.id"))
+    teacher_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("teachers.id"), index=True)
+    yoga_type_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("yoga_types.id"), index=True)
     schedule: Mapped[str] = mapped_column(String(200))  # Keep for backward compatibility
     duration_minutes: Mapped[int] = mapped_column(Integer)
     difficulty: Mapped[str] = mapped_column(String(50))
@@ -24,7 +26,7 @@ class YogaClass(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # NEW FIELDS for schedule integration
-    schedule_data: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON structure
+    schedule_data: Mapped[dict | None] = mapped_column(JSON().with_variant(JSONB, "postgresql"), nullable=True)  # Parsed schedule structure
     schedule_type: Mapped[str] = mapped_column(String(20), default="recurring")  # recurring, one_time, custom
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)  # Enable/disable class
 
@@ -1,24 +1,27 @@
 import uuid
 import json
 from datetime import timedelta
-from typing import List
-from pathlib import Path
-import shutil
+from typing import List, Optional
 import json
 import base64
 from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Response, Request
+from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Response, Request, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import exists, select, func, true, tuple_, update
+from sqlalchemy.orm import aliased, joinedload, selectinload
 
 from app.database import get_db
-from app.auth import authenticate_admin, create_access_token, get_current_admin
+from app.auth import authenticate_admin, create_access_token, encode_admin_subject, get_current_admin
+from app.cache import TTLCache, conditional_json_response, etag_for
+from app.uploads import MAX_IMAGE_SIZE, TEACHER_PHOTO_DIR, save_upload_by_content, sniff_image_extension
 from app.config import settings
 from app.services.schedule_parser import ScheduleParserService
 from app.services.payment_service import PaymentService
 from app.models.admin_user import AdminUser
-from app.models.registration import Registration
+from app.models.entity_counter import EntityCounter
+from app.models.payment import Payment
+from app.models.registration import Registration, REGISTRATION_STATUSES
 from app.models.teacher import Teacher
 from app.models.yoga_class import YogaClass
 from app.models.yoga_type import YogaType
@@ -27,15 +30,39 @@ from app.schemas.admin import (
     AdminTokenOut,
     AdminUserOut,
     RegistrationStatusUpdate,
+    RegistrationBulkStatusUpdate,
+    RegistrationBulkStatusOut,
     AdminStatsOut
 )
-from app.schemas.registration import RegistrationOutWithSchedule
+from app.schemas.registration import REGISTRATION_LIST_ADAPTER, RegistrationOutWithSchedule
 from app.schemas.teacher import TeacherOut, TeacherUpdate
 from app.schemas.yoga_class import YogaClassOut, YogaClassCreate
 from app.schemas.yoga_type import YogaTypeOut, YogaTypeCreate, YogaTypeUpdate
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
+# Lifetime of the admin session token and the cookies that carry it
+ADMIN_SESSION_TTL = timedelta(minutes=30)
+_ADMIN_SESSION_MAX_AGE = int(ADMIN_SESSION_TTL.total_seconds())
+
+# The parser keeps no per-request state, so one instance serves every request
+_SCHEDULE_PARSER = ScheduleParserService()
+
+_VALID_STATUSES = frozenset(REGISTRATION_STATUSES)
+_INVALID_STATUS_DETAIL = f"Invalid status. Must be one of: {', '.join(REGISTRATION_STATUSES)}"
+
+# Dashboard stats are polled by the admin UI far more often than they change, so
+# the payload is kept for a few seconds and dropped whenever the data behind it
+# is written through the ORM.
+DASHBOARD_STATS_TTL_SECONDS = 10
+_dashboard_stats_cache = TTLCache(DASHBOARD_STATS_TTL_SECONDS)
+_dashboard_stats_cache.clear_on_write(Registration, Teacher, YogaClass, Payment)
+
+
+def clear_dashboard_stats_cache() -> None:
+    """Drop the cached dashboard stats payload."""
+    _dashboard_stats_cache.clear()
+
 
 @router.post("/login", response_model=AdminTokenOut)
 async def admin_login(
@@ -52,9 +79,10 @@ async def admin_login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token_expires = timedelta(minutes=30)  # 30 minutes for session
+    # HS256 signing of a one-claim token is a few microseconds of hashlib work,
+    # cheaper than handing it to a worker thread, so it stays inline
     access_token = create_access_token(
-        data={"sub": str(admin.id)}, expires_delta=access_token_expires
+        data={"sub": encode_admin_subject(admin.id)}, expires_delta=ADMIN_SESSION_TTL, _copy=False
     )
 
     # Set session cookies
@@ -64,30 +92,32 @@ async def admin_login(
     response.set_cookie(
         key="admin_session",
         value=access_token,
-        max_age=1800,  # 30 minutes in seconds
+        max_age=_ADMIN_SESSION_MAX_AGE,
         httponly=True,
         secure=is_production,
         samesite="lax",  # Changed from "strict" to "lax" for development
         path="/"
     )
 
-    # Create admin user data as JSON
+    # Create admin user data as JSON. Only what the admin header renders goes in
+    # this script-readable cookie; it rides along on every admin request.
     admin_user_data = {
         "id": str(admin.id),
         "username": admin.username,
-        "email": admin.email,
         "role": admin.role
     }
 
-    # Convert to JSON and encode as Base64 to avoid cookie character issues
-    admin_user_json = json.dumps(admin_user_data)
+    # Convert to JSON and encode as Base64 to avoid cookie character issues.
+    # Compact separators keep the cookie small; json.dumps (not orjson) is kept
+    # because its ASCII escaping is what lets the frontend decode with atob().
+    admin_user_json = json.dumps(admin_user_data, separators=(",", ":"))
     admin_user_base64 = base64.b64encode(admin_user_json.encode()).decode()
 
 
     response.set_cookie(
         key="admin_user",
         value=admin_user_base64,  # Use Base64 encoded JSON
-        max_age=1800,  # 30 minutes in seconds
+        max_age=_ADMIN_SESSION_MAX_AGE,
         httponly=False,  # Allow client-side access for user info
         secure=is_production,
         samesite="lax",  # Changed from "strict" to "lax" for development
@@ -165,59 +195,111 @@ async def get_current_admin_info(admin: AdminUser = Depends(get_current_admin)):
     return AdminUserOut.model_validate(admin)
 
 
+def _entity_count(name: str, model):
+    """Maintained counter for `name`, falling back to COUNT(*) if it has not been seeded."""
+    return func.coalesce(
+        select(EntityCounter.value).where(EntityCounter.name == name).scalar_subquery(),
+        select(func.count()).select_from(model).scalar_subquery(),
+    ).label(f"total_{name}")
+
+
 @router.get("/dashboard/stats", response_model=AdminStatsOut)
 async def get_dashboard_stats(
+    request: Request,
     admin: AdminUser = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db)
 ):
     """Get dashboard statistics."""
-    # Get total counts
-    total_registrations_query = select(func.count(Registration.id))
-    total_teachers_query = select(func.count(Teacher.id))
-    total_classes_query = select(func.count(YogaClass.id))
-
-    total_registrations_result = await db.execute(total_registrations_query)
-    total_teachers_result = await db.execute(total_teachers_query)
-    total_classes_result = await db.execute(total_classes_query)
-
-    # Get recent registrations (last 5)
-    recent_registrations_query = (
+    # The serialized payload and its ETag are cached together, so a hit does no
+    # Pydantic work and a matching If-None-Match sends no body at all
+    cached = _dashboard_stats_cache.get("stats")
+    if cached is not None:
+        return conditional_json_response(request, *cached)
+
+    # Entity counts, payment stats and the five most recent registrations (with
+    # their payments) come back from one statement: the single-row aggregates are
+    # outer-joined to the recent rows, so they are still returned when there are
+    # no registrations yet.
+    counts = select(
+        _entity_count("registrations", Registration),
+        _entity_count("teachers", Teacher),
+        _entity_count("classes", YogaClass),
+    ).subquery("counts")
+    payment_stats = PaymentService.payment_stats_query().subquery("payment_stats")
+    recent = (
         select(Registration)
         .order_by(Registration.created_at.desc())
         .limit(5)
+        .subquery("recent")
+    )
+    recent_registration = aliased(Registration, recent)
+    overview_query = (
+        select(counts, payment_stats, recent_registration)
+        .select_from(counts)
+        .join(payment_stats, true())
+        .outerjoin(recent, true())
+        .options(joinedload(recent_registration.payment))
+        .order_by(recent.c.created_at.desc())
     )
-    recent_registrations_result = await db.execute(recent_registrations_query)
-    recent_registrations = recent_registrations_result.scalars().all()
-
-    # Get payment stats
-    payment_service = PaymentService()
-    payment_stats = await payment_service.get_payment_stats(db)
-
-    return AdminStatsOut(
-        total_registrations=total_registrations_result.scalar(),
-        total_teachers=total_teachers_result.scalar(),
-        total_classes=total_classes_result.scalar(),
-        recent_registrations=[
-            RegistrationOutWithSchedule.model_validate(r) for r in recent_registrations
-        ],
-        pending_payments=payment_stats["pending_payments"],
-        total_revenue=payment_stats["total_revenue"],
-        total_revenue_cny=payment_stats["total_revenue_cny"],
-        total_revenue_usd=payment_stats["total_revenue_usd"],
+    rows = (await db.execute(overview_query)).unique().all()
+    overview = rows[0]
+    recent_registrations = [row[-1] for row in rows if row[-1] is not None]
+
+    stats = AdminStatsOut(
+        total_registrations=overview.total_registrations,
+        total_teachers=overview.total_teachers,
+        total_classes=overview.total_classes,
+        recent_registrations=REGISTRATION_LIST_ADAPTER.validate_python(recent_registrations),
+        pending_payments=overview.pending,
+        total_revenue=float(overview.revenue),
+        total_revenue_cny=float(overview.revenue_cny),
+        total_revenue_usd=float(overview.revenue_usd),
     )
+    body = stats.model_dump_json().encode()
+    cached = (body, etag_for(body))
+    _dashboard_stats_cache.set("stats", cached)
+    return conditional_json_response(request, *cached)
 
 
 @router.get("/registrations", response_model=List[RegistrationOutWithSchedule])
 async def list_registrations(
+    request: Request,
+    cursor: Optional[uuid.UUID] = Query(default=None),
+    limit: Optional[int] = Query(default=None, ge=1, le=500),
     admin: AdminUser = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get all registrations."""
-    query = select(Registration).order_by(Registration.created_at.desc())
+    """Get registrations, newest first.
+
+    Returns every registration unless `limit` is given. Paged callers pass the
+    X-Next-Cursor header from the previous page as `cursor` to fetch the
+    registrations that follow it.
+    """
+    # Payments are batch-loaded with one IN query rather than per registration
+    query = (
+        select(Registration)
+        .options(selectinload(Registration.payment))
+        .order_by(Registration.created_at.desc(), Registration.id.desc())
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    if cursor is not None:
+        anchor = (
+            select(Registration.created_at, Registration.id)
+            .where(Registration.id == cursor)
+            .scalar_subquery()
+        )
+        query = query.where(tuple_(Registration.created_at, Registration.id) < anchor)
+
     result = await db.execute(query)
     registrations = result.scalars().all()
 
-    return [RegistrationOutWithSchedule.model_validate(r) for r in registrations]
+    headers = {}
+    if limit is not None and len(registrations) == limit:
+        headers["X-Next-Cursor"] = str(registrations[-1].id)
+
+    body = REGISTRATION_LIST_ADAPTER.dump_json(REGISTRATION_LIST_ADAPTER.validate_python(registrations))
+    return conditional_json_response(request, body, etag_for(body), headers)
 
 
 @router.get("/registrations/{registration_id}", response_model=RegistrationOutWithSchedule)
@@ -227,7 +309,12 @@ async def get_registration(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific registration."""
-    query = select(Registration).where(Registration.id == registration_id)
+    # One row, so join the payment in rather than batching it in a second SELECT
+    query = (
+        select(Registration)
+        .options(joinedload(Registration.payment))
+        .where(Registration.id == registration_id)
+    )
     result = await db.execute(query)
     registration = result.scalar_one_or_none()
 
@@ -237,6 +324,31 @@ async def get_registration(
     return RegistrationOutWithSchedule.model_validate(registration)
 
 
+@router.put("/registrations/bulk-status", response_model=RegistrationBulkStatusOut)
+async def bulk_update_registration_status(
+    status_data: RegistrationBulkStatusUpdate,
+    admin: AdminUser = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    """Update the status of many registrations in one statement."""
+    if status_data.status not in _VALID_STATUSES:
+        raise HTTPException(status_code=400, detail=_INVALID_STATUS_DETAIL)
+
+    query = (
+        update(Registration)
+        .where(Registration.id.in_(status_data.ids))
+        .values(status=status_data.status)
+        .returning(Registration.id)
+    )
+    result = await db.execute(query)
+    updated_ids = list(result.scalars().all())
+
+    await db.commit()
+    clear_dashboard_stats_cache()
+
+    return RegistrationBulkStatusOut(updated=updated_ids)
+
+
 @router.put("/registrations/{registration_id}/status", response_model=RegistrationOutWithSchedule)
 async def update_registration_status(
     registration_id: uuid.UUID,
@@ -245,24 +357,27 @@ async def update_registration_status(
     db: AsyncSession = Depends(get_db)
 ):
     """Update registration status."""
-    query = select(Registration).where(Registration.id == registration_id)
+    # Validate status before touching the database
+    if status_data.status not in _VALID_STATUSES:
+        raise HTTPException(status_code=400, detail=_INVALID_STATUS_DETAIL)
+
+    # Single UPDATE ... RETURNING instead of SELECT, UPDATE and a refresh SELECT
+    query = (
+        update(Registration)
+        .where(Registration.id == registration_id)
+        .values(status=status_data.status)
+        .returning(Registration)
+        .options(selectinload(Registration.payment))
+    )
     result = await db.execute(query)
     registration = result.scalar_one_or_none()
 
     if not registration:
         raise HTTPException(status_code=404, detail="Registration not found")
 
-    # Validate status
-    valid_statuses = ["confirmed", "waitlist", "cancelled", "pending_payment"]
-    if status_data.status not in valid_statuses:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
-        )
-
-    registration.status = status_data.status
     await db.commit()
-    await db.refresh(registration)
+    # Bulk UPDATE bypasses the ORM flush events that normally invalidate this
+    clear_dashboard_stats_cache()
 
     return RegistrationOutWithSchedule.model_validate(registration)
 
@@ -285,7 +400,6 @@ async def create_teacher(
 
     db.add(teacher)
     await db.commit()
-    await db.refresh(teacher)
 
     return teacher
 
@@ -298,23 +412,20 @@ async def update_teacher(
     db: AsyncSession = Depends(get_db)
 ):
     """Update teacher information."""
-    query = select(Teacher).where(Teacher.id == teacher_id)
+    # Single UPDATE ... RETURNING instead of SELECT, UPDATE and a refresh SELECT
+    query = (
+        update(Teacher)
+        .where(Teacher.id == teacher_id)
+        .values(**teacher_data.model_dump(exclude_unset=True))
+        .returning(Teacher)
+    )
     result = await db.execute(query)
     teacher = result.scalar_one_or_none()
 
     if not teacher:
         raise HTTPException(status_code=404, detail="Teacher not found")
 
-    # Update teacher fields
-    teacher.name_en = teacher_data.name_en
-    teacher.name_zh = teacher_data.name_zh
-    teacher.bio_en = teacher_data.bio_en
-    teacher.bio_zh = teacher_data.bio_zh
-    teacher.qualifications = teacher_data.qualifications
-    teacher.photo_url = teacher_data.photo_url
-
     await db.commit()
-    await db.refresh(teacher)
 
     return TeacherOut.model_validate(teacher)
 
@@ -327,15 +438,16 @@ async def upload_teacher_photo(
     db: AsyncSession = Depends(get_db)
 ):
     """Upload a photo for a teacher."""
-    # Validate file type
-    if not file.content_type or not file.content_type.startswith('image/'):
+    # Validate file type from the content itself; the extension follows from it
+    file_extension = await sniff_image_extension(file)
+    if file_extension is None:
         raise HTTPException(
             status_code=400,
             detail="File must be an image (jpg, png, gif, etc.)"
         )
 
     # Validate file size (5MB limit)
-    max_size = 5 * 1024 * 1024  # 5MB
+    max_size = MAX_IMAGE_SIZE
     if file.size and file.size > max_size:
         raise HTTPException(
             status_code=400,
@@ -350,32 +462,11 @@ async def upload_teacher_photo(
     if not teacher:
         raise HTTPException(status_code=404, detail="Teacher not found")
 
-    # Create upload directory
-    upload_dir = Path("uploads/teachers")
-    upload_dir.mkdir(parents=True, exist_ok=True)
-
-    # Generate unique filename
-    file_extension = ""
-    if file.filename and "." in file.filename:
-        file_extension = file.filename.split('.')[-1]
-    else:
-        # Default extension based on content type
-        if file.content_type == "image/jpeg":
-            file_extension = "jpg"
-        elif file.content_type == "image/png":
-            file_extension = "png"
-        elif file.content_type == "image/gif":
-            file_extension = "gif"
-        else:
-            file_extension = "jpg"
-
-    filename = f"{teacher_id}_{uuid.uuid4().hex}.{file_extension}"
-    file_path = upload_dir / filename
-
-    # Save file
+    # Save file under a content-derived name, reusing an identical earlier upload
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        filename = await save_upload_by_content(file, TEACHER_PHOTO_DIR, file_extension, max_size)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -387,7 +478,6 @@ async def upload_teacher_photo(
     # Update teacher record with new photo URL (use absolute URL)
     teacher.photo_url = f"{settings.server_url}/uploads/teachers/{filename}"
     await db.commit()
-    await db.refresh(teacher)
 
     return {
         "message": "Photo uploaded successfully",
@@ -396,6 +486,19 @@ async def upload_teacher_photo(
     }
 
 
+async def _ensure_class_references(db: AsyncSession, class_data: YogaClassCreate) -> None:
+    """Raise 404 unless the class's teacher and yoga type both exist, checked in one query."""
+    query = select(
+        exists().where(Teacher.id == class_data.teacher_id).label("teacher"),
+        exists().where(YogaType.id == class_data.yoga_type_id).label("yoga_type"),
+    )
+    found = (await db.execute(query)).one()
+    if not found.teacher:
+        raise HTTPException(status_code=404, detail="Teacher not found")
+    if not found.yoga_type:
+        raise HTTPException(status_code=404, detail="Yoga type not found")
+
+
 @router.post("/classes", response_model=YogaClassOut)
 async def create_class(
     class_data: YogaClassCreate,
@@ -403,23 +506,10 @@ async def create_class(
     db: AsyncSession = Depends(get_db)
 ):
     """Create a new yoga class."""
-    # Verify teacher exists
-    teacher_query = select(Teacher).where(Teacher.id == class_data.teacher_id)
-    teacher_result = await db.execute(teacher_query)
-    teacher = teacher_result.scalar_one_or_none()
-    if not teacher:
-        raise HTTPException(status_code=404, detail="Teacher not found")
-
-    # Verify yoga type exists
-    yoga_type_query = select(YogaType).where(YogaType.id == class_data.yoga_type_id)
-    yoga_type_result = await db.execute(yoga_type_query)
-    yoga_type = yoga_type_result.scalar_one_or_none()
-    if not yoga_type:
-        raise HTTPException(status_code=404, detail="Yoga type not found")
+    await _ensure_class_references(db, class_data)
 
     # Parse schedule string into structured data
-    schedule_parser = ScheduleParserService()
-    parsed_schedule = schedule_parser.parse_schedule_string(class_data.schedule)
+    parsed_schedule = _SCHEDULE_PARSER.parse_schedule_string(class_data.schedule)
 
     # Create the class
     yoga_class = YogaClass(
@@ -430,7 +520,7 @@ async def create_class(
         teacher_id=class_data.teacher_id,
         yoga_type_id=class_data.yoga_type_id,
         schedule=class_data.schedule,
-        schedule_data=json.dumps(parsed_schedule),  # Save structured schedule data
+        schedule_data=parsed_schedule,  # Save structured schedule data
         duration_minutes=class_data.duration_minutes,
         difficulty=class_data.difficulty,
         capacity=class_data.capacity,
@@ -457,53 +547,30 @@ async def update_class(
     db: AsyncSession = Depends(get_db)
 ):
     """Update an existing yoga class."""
-    # Find the class
-    query = select(YogaClass).where(YogaClass.id == class_id)
+    await _ensure_class_references(db, class_data)
+
+    # Parse schedule string into structured data
+    parsed_schedule = _SCHEDULE_PARSER.parse_schedule_string(class_data.schedule)
+
+    # Single UPDATE ... RETURNING instead of SELECT, UPDATE and a refresh SELECT
+    query = (
+        update(YogaClass)
+        .where(YogaClass.id == class_id)
+        .values(**class_data.model_dump(), schedule_data=parsed_schedule)
+        .returning(YogaClass)
+        .options(
+            selectinload(YogaClass.teacher),
+            selectinload(YogaClass.yoga_type),
+            selectinload(YogaClass.packages),
+        )
+    )
     result = await db.execute(query)
     yoga_class = result.scalar_one_or_none()
 
     if not yoga_class:
         raise HTTPException(status_code=404, detail="Class not found")
 
-    # Verify teacher exists
-    teacher_query = select(Teacher).where(Teacher.id == class_data.teacher_id)
-    teacher_result = await db.execute(teacher_query)
-    teacher = teacher_result.scalar_one_or_none()
-    if not teacher:
-        raise HTTPException(status_code=404, detail="Teacher not found")
-
-    # Verify yoga type exists
-    yoga_type_query = select(YogaType).where(YogaType.id == class_data.yoga_type_id)
-    yoga_type_result = await db.execute(yoga_type_query)
-    yoga_type = yoga_type_result.scalar_one_or_none()
-    if not yoga_type:
-        raise HTTPException(status_code=404, detail="Yoga type not found")
-
-    # Parse schedule string into structured data
-    schedule_parser = ScheduleParserService()
-    parsed_schedule = schedule_parser.parse_schedule_string(class_data.schedule)
-
-    # Update class fields
-    yoga_class.name_en = class_data.name_en
-    yoga_class.name_zh = class_data.name_zh
-    yoga_class.description_en = class_data.description_en
-    yoga_class.description_zh = class_data.description_zh
-    yoga_class.teacher_id = class_data.teacher_id
-    yoga_class.yoga_type_id = class_data.yoga_type_id
-    yoga_class.schedule = class_data.schedule
-    yoga_class.schedule_data = json.dumps(parsed_schedule)  # Update structured schedule data
-    yoga_class.duration_minutes = class_data.duration_minutes
-    yoga_class.difficulty = class_data.difficulty
-    yoga_class.capacity = class_data.capacity
-    yoga_class.location = class_data.location
-    yoga_class.schedule_type = class_data.schedule_type
-    yoga_class.is_active = class_data.is_active
-    yoga_class.price = class_data.price
-    yoga_class.price_usd = class_data.price_usd
-    yoga_class.currency = class_data.currency
-
     await db.commit()
-    await db.refresh(yoga_class, ["teacher", "yoga_type", "packages"])
 
     return yoga_class
 
@@ -525,7 +592,6 @@ async def create_yoga_type(
 
     db.add(yoga_type)
     await db.commit()
-    await db.refresh(yoga_type)
 
     return yoga_type
 
@@ -538,21 +604,19 @@ async def update_yoga_type(
     db: AsyncSession = Depends(get_db)
 ):
     """Update yoga type information."""
-    query = select(YogaType).where(YogaType.id == yoga_type_id)
+    # Single UPDATE ... RETURNING instead of SELECT, UPDATE and a refresh SELECT
+    query = (
+        update(YogaType)
+        .where(YogaType.id == yoga_type_id)
+        .values(**yoga_type_data.model_dump(exclude_unset=True))
+        .returning(YogaType)
+    )
     result = await db.execute(query)
     yoga_type = result.scalar_one_or_none()
 
     if not yoga_type:
         raise HTTPException(status_code=404, detail="Yoga type not found")
 
-    # Update yoga type fields
-    yoga_type.name_en = yoga_type_data.name_en
-    yoga_type.name_zh = yoga_type_data.name_zh
-    yoga_type.description_en = yoga_type_data.description_en
-    yoga_type.description_zh = yoga_type_data.description_zh
-    yoga_type.image_url = yoga_type_data.image_url
-
     await db.commit()
-    await db.refresh(yoga_type)
 
     return yoga_type
\ No newline at end of file
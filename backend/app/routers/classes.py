@@ -1,41 +1,78 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, selectinload
 
+from app.cache import TTLCache, conditional_json_response, etag_for
 from app.database import get_db
+from app.models.class_package import ClassPackage
+from app.models.teacher import Teacher
 from app.models.yoga_class import YogaClass
+from app.models.yoga_type import YogaType
 from app.schemas.yoga_class import YogaClassOut
 
 router = APIRouter(prefix="/api/classes", tags=["classes"])
 
+# Class listings are reused as serialized JSON until a class, or a teacher, yoga
+# type or package embedded in one, is written. The cache is per process: with
+# several workers only the one that committed the write drops its copy, so the
+# others keep serving the old listing and its ETag for up to the TTL.
+CLASSES_TTL_SECONDS = 60
+_classes_cache = TTLCache(CLASSES_TTL_SECONDS)
+_classes_cache.clear_on_write(YogaClass, Teacher, YogaType, ClassPackage)
+
+_CLASS_LIST_ADAPTER = TypeAdapter(list[YogaClassOut])
+
+# Shared caches may keep listings but must revalidate, which the ETag makes cheap
+_PUBLIC_CACHE_CONTROL = "public, no-cache"
+
+
+async def _serialized_classes(db: AsyncSession, query) -> tuple[bytes, str]:
+    result = await db.execute(query)
+    body = _CLASS_LIST_ADAPTER.dump_json(_CLASS_LIST_ADAPTER.validate_python(result.scalars().all()))
+    return body, etag_for(body)
+
 
 @router.get("", response_model=list[YogaClassOut])
-async def list_classes(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(YogaClass)
-        .options(selectinload(YogaClass.teacher), selectinload(YogaClass.yoga_type), selectinload(YogaClass.packages))
-    )
-    return result.scalars().all()
+async def list_classes(request: Request, db: AsyncSession = Depends(get_db)):
+    cached = _classes_cache.get("all")
+    if cached is None:
+        cached = await _serialized_classes(
+            db,
+            select(YogaClass)
+            .options(defer(YogaClass.schedule_data))
+            .options(selectinload(YogaClass.teacher), selectinload(YogaClass.yoga_type), selectinload(YogaClass.packages)),
+        )
+        _classes_cache.set("all", cached)
+    return conditional_json_response(request, *cached, cache_control=_PUBLIC_CACHE_CONTROL)
 
 
 @router.get("/teacher/{teacher_id}", response_model=list[YogaClassOut])
-async def get_classes_by_teacher(teacher_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(YogaClass)
-        .where(YogaClass.teacher_id == teacher_id)
-        .options(selectinload(YogaClass.teacher), selectinload(YogaClass.yoga_type), selectinload(YogaClass.packages))
-        .order_by(YogaClass.name_en)
-    )
-    return result.scalars().all()
+async def get_classes_by_teacher(request: Request, teacher_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    cached = _classes_cache.get(teacher_id)
+    if cached is None:
+        cached = await _serialized_classes(
+            db,
+            select(YogaClass)
+            .options(defer(YogaClass.schedule_data))
+            .where(YogaClass.teacher_id == teacher_id)
+            .options(selectinload(YogaClass.teacher), selectinload(YogaClass.yoga_type), selectinload(YogaClass.packages))
+            .order_by(YogaClass.name_en),
+        )
+        # Only cache ids of real teachers, so unknown ids from the URL can't grow the cache.
+        if await db.get(Teacher, teacher_id) is not None:
+            _classes_cache.set(teacher_id, cached)
+    return conditional_json_response(request, *cached, cache_control=_PUBLIC_CACHE_CONTROL)
 
 
 @router.get("/{class_id}", response_model=YogaClassOut)
 async def get_class(class_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     result = await db.execute(
         select(YogaClass)
+        .options(defer(YogaClass.schedule_data))
         .where(YogaClass.id == class_id)
         .options(selectinload(YogaClass.teacher), selectinload(YogaClass.yoga_type), selectinload(YogaClass.packages))
     )
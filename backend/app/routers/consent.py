@@ -1,11 +1,14 @@
 import uuid
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import TTLCache
 from app.database import get_db
 from app.auth import get_current_admin
 from app.models.admin_user import AdminUser
+from app.models.consent_record import ConsentRecord
+from app.models.yoga_type import YogaType
 from app.schemas.consent import (
     ConsentCreate,
     ConsentOut,
@@ -20,6 +23,15 @@ router = APIRouter(prefix="/api/consent", tags=["consent"])
 # Admin router for managing consent records
 admin_router = APIRouter(prefix="/api/admin/consent", tags=["admin-consent"])
 
+# Services keep no per-request state, so one instance serves every request
+_CONSENT_SERVICE = ConsentService()
+
+# Consent stats are read on every admin dashboard refresh but only change when a
+# waiver is signed or a yoga type is written
+CONSENT_STATS_TTL_SECONDS = 120
+_consent_stats_cache = TTLCache(CONSENT_STATS_TTL_SECONDS)
+_consent_stats_cache.clear_on_write(ConsentRecord, YogaType)
+
 
 @router.get("/check", response_model=ConsentCheckResult)
 async def check_consent(
@@ -28,8 +40,7 @@ async def check_consent(
     db: AsyncSession = Depends(get_db),
 ):
     """Check if a consent record exists for the given email and yoga type."""
-    consent_service = ConsentService()
-    record = await consent_service.check_consent(email, yoga_type_id, db)
+    record = await _CONSENT_SERVICE.check_consent(email, yoga_type_id, db)
     if record:
         return ConsentCheckResult(has_consent=True, consent=ConsentOut.model_validate(record))
     return ConsentCheckResult(has_consent=False)
@@ -42,29 +53,36 @@ async def sign_consent(
     db: AsyncSession = Depends(get_db),
 ):
     """Sign a consent waiver. Idempotent — returns existing record if already signed."""
-    consent_service = ConsentService()
     ip_address = request.client.host if request.client else None
-    record = await consent_service.create_consent(consent_data, db, ip_address=ip_address)
+    record = await _CONSENT_SERVICE.create_consent(consent_data, db, ip_address=ip_address)
     return record
 
 
 @admin_router.get("/consents", response_model=List[ConsentListItem])
 async def list_consents(
+    response: Response,
     email: Optional[str] = Query(None),
     yoga_type_id: Optional[uuid.UUID] = Query(None),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[uuid.UUID] = Query(None),
     db: AsyncSession = Depends(get_db),
     current_admin: AdminUser = Depends(get_current_admin),
 ):
-    """List all consent records with optional filtering (admin only)."""
-    consent_service = ConsentService()
-    records = await consent_service.get_all_consents(
-        db, email=email, yoga_type_id=yoga_type_id, limit=limit, offset=offset
+    """List all consent records with optional filtering (admin only).
+
+    Pass the X-Next-Cursor header from the previous page as `cursor` to page
+    without an OFFSET scan.
+    """
+    records = await _CONSENT_SERVICE.get_all_consents(
+        db, email=email, yoga_type_id=yoga_type_id, limit=limit, offset=offset, cursor=cursor
     )
+    if len(records) == limit:
+        response.headers["X-Next-Cursor"] = str(records[-1].id)
+    # Values come straight from typed columns, so the items skip validation
     items = []
     for r in records:
-        item = ConsentListItem(
+        item = ConsentListItem.model_construct(
             id=r.id,
             email=r.email,
             name=r.name,
@@ -84,5 +102,8 @@ async def get_consent_stats(
     current_admin: AdminUser = Depends(get_current_admin),
 ):
     """Get consent statistics for admin dashboard."""
-    consent_service = ConsentService()
-    return await consent_service.get_consent_stats(db)
+    stats = _consent_stats_cache.get("stats")
+    if stats is None:
+        stats = await _CONSENT_SERVICE.get_consent_stats(db)
+        _consent_stats_cache.set("stats", stats)
+    return stats
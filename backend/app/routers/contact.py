@@ -1,18 +1,23 @@
 import uuid
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.auth import get_current_admin
 from app.models.admin_user import AdminUser
+from app.models.contact_inquiry import ContactInquiry
+from app.models.inquiry_reply import InquiryReply
 from app.schemas.contact import (
     ContactInquiryCreate,
     ContactInquiryOut,
     ContactInquiryUpdate,
     ContactInquirySummary,
     InquiryReplyCreate,
-    InquiryReplyOut
+    InquiryReplyOut,
+    InquiryStatus,
+    InquiryCategory,
+    INQUIRY_SUMMARY_LIST_ADAPTER,
 )
 from app.services.contact_service import ContactService
 from app.services.notification_service import NotificationService
@@ -23,25 +28,24 @@ router = APIRouter(prefix="/api/contact", tags=["contact"])
 # Admin router for managing inquiries
 admin_router = APIRouter(prefix="/api/admin/contact", tags=["admin-contact"])
 
+# The services keep no per-request state, so one instance of each serves every request
+_CONTACT_SERVICE = ContactService()
+_NOTIFICATION_SERVICE = NotificationService()
+
 
 @router.post("/inquiries", response_model=ContactInquiryOut, status_code=201)
 async def submit_inquiry(
     inquiry_data: ContactInquiryCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """Submit a new contact inquiry (public endpoint)."""
-    contact_service = ContactService()
-    notification_service = NotificationService()
-
     try:
         # Create the inquiry
-        inquiry = await contact_service.create_inquiry(inquiry_data, db)
+        inquiry = await _CONTACT_SERVICE.create_inquiry(inquiry_data, db)
 
-        # Send confirmation email to user
-        await notification_service.send_inquiry_confirmation_email(inquiry, db)
-
-        # Send notification email to admin
-        await notification_service.send_admin_inquiry_notification(inquiry, db)
+        # Email the user and the admin after the response has gone out
+        background_tasks.add_task(_NOTIFICATION_SERVICE.send_inquiry_notifications, inquiry, db)
 
         return inquiry
 
@@ -51,19 +55,20 @@ async def submit_inquiry(
 
 @admin_router.get("/inquiries", response_model=List[ContactInquirySummary])
 async def list_inquiries(
-    status: Optional[str] = Query(None, pattern="^(open|in_progress|resolved|closed)$"),
-    category: Optional[str] = Query(None, pattern="^(scheduling|general|business)$"),
+    status: Optional[InquiryStatus] = Query(None),
+    category: Optional[InquiryCategory] = Query(None),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db),
     current_admin: AdminUser = Depends(get_current_admin)
 ):
     """Get list of contact inquiries (admin only)."""
-    contact_service = ContactService()
-    inquiries = await contact_service.get_all_inquiries(
+    inquiries = await _CONTACT_SERVICE.get_all_inquiries(
         db, status=status, category=category, limit=limit, offset=offset
     )
-    return inquiries
+    # Serialized straight to JSON bytes; FastAPI skips its own response_model pass
+    body = INQUIRY_SUMMARY_LIST_ADAPTER.dump_json(INQUIRY_SUMMARY_LIST_ADAPTER.validate_python(inquiries))
+    return Response(content=body, media_type="application/json")
 
 
 @admin_router.get("/inquiries/{inquiry_id}", response_model=ContactInquiryOut)
@@ -73,8 +78,7 @@ async def get_inquiry(
     current_admin: AdminUser = Depends(get_current_admin)
 ):
     """Get a specific inquiry by ID (admin only)."""
-    contact_service = ContactService()
-    inquiry = await contact_service.get_inquiry_by_id(inquiry_id, db)
+    inquiry = await _CONTACT_SERVICE.get_inquiry_by_id(inquiry_id, db)
 
     if not inquiry:
         raise HTTPException(status_code=404, detail="Inquiry not found")
@@ -90,8 +94,7 @@ async def update_inquiry(
     current_admin: AdminUser = Depends(get_current_admin)
 ):
     """Update an inquiry status and notes (admin only)."""
-    contact_service = ContactService()
-    inquiry = await contact_service.update_inquiry(inquiry_id, update_data, db)
+    inquiry = await _CONTACT_SERVICE.update_inquiry(inquiry_id, update_data, db)
 
     if not inquiry:
         raise HTTPException(status_code=404, detail="Inquiry not found")
@@ -105,8 +108,7 @@ async def get_inquiry_stats(
     current_admin: AdminUser = Depends(get_current_admin)
 ):
     """Get contact inquiry statistics for admin dashboard."""
-    contact_service = ContactService()
-    stats = await contact_service.get_inquiry_stats(db)
+    stats = await _CONTACT_SERVICE.get_inquiry_stats(db)
     return stats
 
 
@@ -114,21 +116,19 @@ async def get_inquiry_stats(
 async def create_reply(
     inquiry_id: uuid.UUID,
     reply_data: InquiryReplyCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_admin: AdminUser = Depends(get_current_admin)
 ):
     """Create a reply to a contact inquiry (admin only)."""
-    contact_service = ContactService()
-    notification_service = NotificationService()
-
     try:
         # Verify the inquiry exists
-        inquiry = await contact_service.get_inquiry_by_id(inquiry_id, db)
+        inquiry = await _CONTACT_SERVICE.get_inquiry_by_id(inquiry_id, db)
         if not inquiry:
             raise HTTPException(status_code=404, detail="Inquiry not found")
 
         # Create the reply
-        reply = await contact_service.create_reply(
+        reply = await _CONTACT_SERVICE.create_reply(
             inquiry_id=inquiry_id,
             admin_id=current_admin.id,
             subject=reply_data.subject,
@@ -136,20 +136,20 @@ async def create_reply(
             db=db
         )
 
-        # Send reply email to user
-        email_sent = await notification_service.send_inquiry_reply_email(reply, inquiry, db)
-
-        # Update reply status based on email result
-        if email_sent:
-            await contact_service.update_reply_status(reply.id, "sent", db)
-        else:
-            await contact_service.update_reply_status(reply.id, "failed", db, error_message="Failed to send email")
-
-        # Refresh reply to get updated status
-        await db.refresh(reply)
+        # The reply is returned as pending; the email goes out after the response
+        background_tasks.add_task(_send_reply_email, reply, inquiry, db)
         return reply
 
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to create reply: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to create reply: {str(e)}")
+
+
+async def _send_reply_email(reply: InquiryReply, inquiry: ContactInquiry, db: AsyncSession):
+    """Email a reply to the inquirer and record on the reply whether it was sent."""
+    email_sent = await _NOTIFICATION_SERVICE.send_inquiry_reply_email(reply, inquiry, db)
+    if email_sent:
+        await _CONTACT_SERVICE.update_reply_status(reply.id, "sent", db)
+    else:
+        await _CONTACT_SERVICE.update_reply_status(reply.id, "failed", db, error_message="Failed to send email")
@@ -1,16 +1,22 @@
+import asyncio
 import uuid
-import shutil
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, Query, File, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, File, UploadFile, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.auth import get_current_admin
+from app.cache import TTLCache
 from app.config import settings
 from app.models.admin_user import AdminUser
+from app.models.payment import PAYMENT_STATUSES, Payment
+from app.models.payment_settings import PaymentSettings
+from app.services.notification_service import NotificationService
 from app.services.payment_service import PaymentService
+from app.services.tracking_service import TrackingService
+from app.uploads import MAX_IMAGE_SIZE, save_upload, sniff_image_extension, unique_upload_name
 from app.schemas.payment import (
     PaymentOut,
     PaymentConfirm,
@@ -22,6 +28,8 @@ from app.schemas.payment import (
     ClassPackageCreate,
     ClassPackageUpdate,
     ClassPackageOut,
+    PAYMENT_LIST_ADAPTER,
+    PACKAGE_LIST_ADAPTER,
 )
 
 # Public router
@@ -30,22 +38,45 @@ router = APIRouter(prefix="/api/payments", tags=["payments"])
 # Admin router
 admin_router = APIRouter(prefix="/api/admin", tags=["admin-payments"])
 
+# The services keep no per-request state, so one instance of each serves every request
+_PAYMENT_SERVICE = PaymentService()
+_NOTIFICATION_SERVICE = NotificationService()
+_TRACKING_SERVICE = TrackingService()
 
-# ---- Public endpoints ----
+# The settings row only changes when an admin edits it, yet every public payment
+# page reads it; the validated row is reused until it is written
+PAYMENT_SETTINGS_TTL_SECONDS = 60
+_payment_settings_cache = TTLCache(PAYMENT_SETTINGS_TTL_SECONDS)
+_payment_settings_cache.clear_on_write(PaymentSettings)
 
-@router.get("/status/{reference_number}", response_model=PaymentInfoOut)
-async def get_payment_status(reference_number: str, db: AsyncSession = Depends(get_db)):
-    """Get payment status by reference number (public)."""
-    payment_service = PaymentService()
-    payment = await payment_service.get_payment_by_reference(reference_number, db)
 
-    if not payment:
-        raise HTTPException(status_code=404, detail="Payment not found")
+def _json_list(adapter, rows) -> Response:
+    """Validate ORM rows and serialize them to JSON bytes in one pass.
+
+    Returning a Response skips FastAPI's response_model validation and
+    jsonable_encoder walk; the decorators keep response_model for the OpenAPI schema.
+    """
+    return Response(content=adapter.dump_json(adapter.validate_python(rows)), media_type="application/json")
 
-    # Get payment settings for QR code and instructions
-    payment_settings = await payment_service.get_payment_settings(db)
 
-    return PaymentInfoOut(
+async def _cached_payment_settings(db: AsyncSession) -> Optional[PaymentSettingsOut]:
+    payment_settings = _payment_settings_cache.get("settings")
+    if payment_settings is None:
+        row = await _PAYMENT_SERVICE.get_payment_settings(db)
+        if row is None:
+            return None
+        payment_settings = PaymentSettingsOut.model_validate(row)
+        _payment_settings_cache.set("settings", payment_settings)
+    return payment_settings
+
+
+def _payment_info_response(payment, payment_settings: Optional[PaymentSettingsOut]) -> Response:
+    """Serialize the public view of a payment together with the QR codes and instructions.
+
+    Every value comes from a typed column or the already validated settings, so the
+    model is built without validation and dumped straight to JSON bytes.
+    """
+    info = PaymentInfoOut.model_construct(
         payment_id=payment.id,
         reference_number=payment.reference_number,
         amount=float(payment.amount),
@@ -60,13 +91,29 @@ async def get_payment_status(reference_number: str, db: AsyncSession = Depends(g
         venmo_payment_instructions_zh=payment_settings.venmo_payment_instructions_zh if payment_settings else None,
         created_at=payment.created_at,
     )
+    return Response(content=info.model_dump_json(), media_type="application/json")
+
+
+# ---- Public endpoints ----
+
+@router.get("/status/{reference_number}", response_model=PaymentInfoOut)
+async def get_payment_status(reference_number: str, db: AsyncSession = Depends(get_db)):
+    """Get payment status by reference number (public)."""
+    payment = await _PAYMENT_SERVICE.get_payment_by_reference(reference_number, db)
+
+    if not payment:
+        raise HTTPException(status_code=404, detail="Payment not found")
+
+    # Get payment settings for QR code and instructions
+    payment_settings = await _cached_payment_settings(db)
+
+    return _payment_info_response(payment, payment_settings)
 
 
 @router.get("/settings", response_model=PaymentSettingsOut)
 async def get_payment_settings_public(db: AsyncSession = Depends(get_db)):
     """Get payment settings (public - QR code URL and instructions)."""
-    payment_service = PaymentService()
-    payment_settings = await payment_service.get_payment_settings(db)
+    payment_settings = await _cached_payment_settings(db)
 
     if not payment_settings:
         raise HTTPException(status_code=404, detail="Payment settings not configured")
@@ -77,45 +124,29 @@ async def get_payment_settings_public(db: AsyncSession = Depends(get_db)):
 @router.get("/registration/{registration_id}", response_model=PaymentInfoOut)
 async def get_payment_by_registration(registration_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Get payment info by registration ID (public)."""
-    payment_service = PaymentService()
-    payment = await payment_service.get_payment_by_registration(registration_id, db)
+    payment = await _PAYMENT_SERVICE.get_payment_by_registration(registration_id, db)
 
     if not payment:
         raise HTTPException(status_code=404, detail="Payment not found for this registration")
 
-    payment_settings = await payment_service.get_payment_settings(db)
+    payment_settings = await _cached_payment_settings(db)
 
-    return PaymentInfoOut(
-        payment_id=payment.id,
-        reference_number=payment.reference_number,
-        amount=float(payment.amount),
-        currency=payment.currency,
-        status=payment.status,
-        payment_method=payment.payment_method,
-        wechat_qr_code_url=payment_settings.wechat_qr_code_url if payment_settings else None,
-        payment_instructions_en=payment_settings.payment_instructions_en if payment_settings else None,
-        payment_instructions_zh=payment_settings.payment_instructions_zh if payment_settings else None,
-        venmo_qr_code_url=payment_settings.venmo_qr_code_url if payment_settings else None,
-        venmo_payment_instructions_en=payment_settings.venmo_payment_instructions_en if payment_settings else None,
-        venmo_payment_instructions_zh=payment_settings.venmo_payment_instructions_zh if payment_settings else None,
-        created_at=payment.created_at,
-    )
+    return _payment_info_response(payment, payment_settings)
 
 
 # ---- Admin endpoints ----
 
 @admin_router.get("/payments", response_model=List[PaymentOut])
 async def list_payments(
-    status: Optional[str] = Query(default=None),
+    status: Optional[Literal[PAYMENT_STATUSES]] = Query(default=None),
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
     admin: AdminUser = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """List all payments with optional status filter."""
-    payment_service = PaymentService()
-    payments = await payment_service.get_all_payments(db, status=status, limit=limit, offset=offset)
-    return [PaymentOut.model_validate(p) for p in payments]
+    payments = await _PAYMENT_SERVICE.get_all_payments(db, status=status, limit=limit, offset=offset)
+    return _json_list(PAYMENT_LIST_ADAPTER, payments)
 
 
 @admin_router.get("/payments/pending", response_model=List[PaymentOut])
@@ -124,9 +155,8 @@ async def list_pending_payments(
     db: AsyncSession = Depends(get_db),
 ):
     """List pending payments only."""
-    payment_service = PaymentService()
-    payments = await payment_service.get_pending_payments(db)
-    return [PaymentOut.model_validate(p) for p in payments]
+    payments = await _PAYMENT_SERVICE.get_pending_payments(db)
+    return _json_list(PAYMENT_LIST_ADAPTER, payments)
 
 
 @admin_router.get("/payments/stats", response_model=PaymentStatsOut)
@@ -135,8 +165,7 @@ async def get_payment_stats(
     db: AsyncSession = Depends(get_db),
 ):
     """Get payment statistics."""
-    payment_service = PaymentService()
-    stats = await payment_service.get_payment_stats(db)
+    stats = await _PAYMENT_SERVICE.get_payment_stats(db)
     return PaymentStatsOut(**stats)
 
 
@@ -147,8 +176,7 @@ async def get_payment_detail(
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific payment."""
-    payment_service = PaymentService()
-    payment = await payment_service.get_payment_by_id(payment_id, db)
+    payment = await _PAYMENT_SERVICE.get_payment_by_id(payment_id, db)
 
     if not payment:
         raise HTTPException(status_code=404, detail="Payment not found")
@@ -156,56 +184,53 @@ async def get_payment_detail(
     return PaymentOut.model_validate(payment)
 
 
+async def _send_payment_confirmed_email(payment: Payment, db: AsyncSession):
+    """Send the payment confirmed email for a payment's registration, if it wants emails.
+
+    Expects the registration and its class to be loaded, as confirm_payment does.
+    """
+    registration = payment.registration
+    if not registration or not registration.email_notifications:
+        return
+
+    tracking_token = await _TRACKING_SERVICE.get_or_create_token(registration.email, db)
+    locale = registration.preferred_language or "en"
+    tracking_url = _TRACKING_SERVICE.build_tracking_url(tracking_token.token, locale)
+
+    # Class details for the email
+    class_email_kwargs = {}
+    yoga_class = registration.yoga_class
+    if yoga_class:
+        class_email_kwargs = {
+            "class_name_en": yoga_class.name_en,
+            "class_name_zh": yoga_class.name_zh,
+            "class_date": registration.target_date.strftime("%A, %B %d, %Y") if registration.target_date else yoga_class.schedule,
+            "class_time": registration.target_time.strftime("%-I:%M %p") if registration.target_time else "",
+            "class_location": yoga_class.location or "",
+        }
+
+    await _NOTIFICATION_SERVICE.send_payment_confirmed_email(registration, payment, db, tracking_url=tracking_url, **class_email_kwargs)
+
+
 @admin_router.post("/payments/{payment_id}/confirm", response_model=PaymentOut)
 async def confirm_payment(
     payment_id: uuid.UUID,
     data: PaymentConfirm,
+    background_tasks: BackgroundTasks,
     admin: AdminUser = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Confirm a payment and update the associated registration."""
-    payment_service = PaymentService()
-
     try:
-        payment = await payment_service.confirm_payment(
+        payment = await _PAYMENT_SERVICE.confirm_payment(
             payment_id, admin.id, db, notes=data.admin_notes
         )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
-    # Send payment confirmed email
-    from app.services.notification_service import NotificationService
-    from app.services.tracking_service import TrackingService
-    from app.models.registration import Registration
-    from app.models.yoga_class import YogaClass
-    from sqlalchemy import select
-
-    notification_service = NotificationService()
-    if payment.registration_id:
-        reg_query = select(Registration).where(Registration.id == payment.registration_id)
-        reg_result = await db.execute(reg_query)
-        registration = reg_result.scalar_one_or_none()
-        if registration and registration.email_notifications:
-            tracking_service = TrackingService()
-            tracking_token = await tracking_service.get_or_create_token(registration.email, db)
-            locale = registration.preferred_language or "en"
-            tracking_url = tracking_service.build_tracking_url(tracking_token.token, locale)
-
-            # Load yoga class for email details
-            class_email_kwargs = {}
-            cls_query = select(YogaClass).where(YogaClass.id == registration.class_id)
-            cls_result = await db.execute(cls_query)
-            yoga_class = cls_result.scalar_one_or_none()
-            if yoga_class:
-                class_email_kwargs = {
-                    "class_name_en": yoga_class.name_en,
-                    "class_name_zh": yoga_class.name_zh,
-                    "class_date": registration.target_date.strftime("%A, %B %d, %Y") if registration.target_date else yoga_class.schedule,
-                    "class_time": registration.target_time.strftime("%-I:%M %p") if registration.target_time else "",
-                    "class_location": yoga_class.location or "",
-                }
-
-            await notification_service.send_payment_confirmed_email(registration, payment, db, tracking_url=tracking_url, **class_email_kwargs)
+    # Email the registrant after the response has gone out
+    if payment.registration:
+        background_tasks.add_task(_send_payment_confirmed_email, payment, db)
 
     return PaymentOut.model_validate(payment)
 
@@ -218,10 +243,8 @@ async def cancel_payment(
     db: AsyncSession = Depends(get_db),
 ):
     """Cancel a payment and update the associated registration."""
-    payment_service = PaymentService()
-
     try:
-        payment = await payment_service.cancel_payment(payment_id, db, notes=data.admin_notes)
+        payment = await _PAYMENT_SERVICE.cancel_payment(payment_id, db, notes=data.admin_notes)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -237,9 +260,8 @@ async def list_packages(
     db: AsyncSession = Depends(get_db),
 ):
     """List packages for a class."""
-    payment_service = PaymentService()
-    packages = await payment_service.get_packages_for_class(class_id, db)
-    return [ClassPackageOut.model_validate(p) for p in packages]
+    packages = await _PAYMENT_SERVICE.get_packages_for_class(class_id, db)
+    return _json_list(PACKAGE_LIST_ADAPTER, packages)
 
 
 @admin_router.post("/packages", response_model=ClassPackageOut, status_code=201)
@@ -249,8 +271,7 @@ async def create_package(
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new class package."""
-    payment_service = PaymentService()
-    package = await payment_service.create_package(data, db)
+    package = await _PAYMENT_SERVICE.create_package(data, db)
     return ClassPackageOut.model_validate(package)
 
 
@@ -262,8 +283,7 @@ async def update_package(
     db: AsyncSession = Depends(get_db),
 ):
     """Update a class package."""
-    payment_service = PaymentService()
-    package = await payment_service.update_package(package_id, data, db)
+    package = await _PAYMENT_SERVICE.update_package(package_id, data, db)
 
     if not package:
         raise HTTPException(status_code=404, detail="Package not found")
@@ -279,12 +299,11 @@ async def get_payment_settings_admin(
     db: AsyncSession = Depends(get_db),
 ):
     """Get payment settings (admin)."""
-    payment_service = PaymentService()
-    payment_settings = await payment_service.get_payment_settings(db)
+    payment_settings = await _PAYMENT_SERVICE.get_payment_settings(db)
 
     if not payment_settings:
         # Create default settings
-        payment_settings = await payment_service.update_payment_settings(db)
+        payment_settings = await _PAYMENT_SERVICE.update_payment_settings(db)
 
     return payment_settings
 
@@ -296,8 +315,7 @@ async def update_payment_settings(
     db: AsyncSession = Depends(get_db),
 ):
     """Update payment settings (instructions text)."""
-    payment_service = PaymentService()
-    payment_settings = await payment_service.update_payment_settings(
+    payment_settings = await _PAYMENT_SERVICE.update_payment_settings(
         db,
         payment_instructions_en=data.payment_instructions_en,
         payment_instructions_zh=data.payment_instructions_zh,
@@ -307,6 +325,35 @@ async def update_payment_settings(
     return payment_settings
 
 
+async def _save_qr_upload(file: UploadFile, prefix: str) -> str:
+    """Validate an uploaded QR code image and stream it into the payment upload dir.
+
+    Returns the stored filename. Disk work runs in worker threads, so a large
+    upload does not hold up other requests.
+    """
+    try:
+        # Validate file type from the content itself; the extension follows from it
+        file_extension = await sniff_image_extension(file)
+        if file_extension is None:
+            raise HTTPException(status_code=400, detail="File must be an image (jpg, png, gif, etc.)")
+
+        # Reject early on the declared size; save_upload enforces the limit on the bytes received
+        if file.size and file.size > MAX_IMAGE_SIZE:
+            raise HTTPException(status_code=400, detail="File size must be less than 5MB")
+
+        upload_dir = Path(settings.upload_dir) / "payment"
+        await asyncio.to_thread(upload_dir.mkdir, parents=True, exist_ok=True)
+
+        filename = unique_upload_name(prefix, file_extension)
+        try:
+            await save_upload(file, upload_dir / filename, MAX_IMAGE_SIZE)
+        except OSError:
+            raise HTTPException(status_code=500, detail="Failed to save uploaded file")
+        return filename
+    finally:
+        await file.close()
+
+
 @admin_router.post("/payment-settings/qr-code")
 async def upload_qr_code(
     file: UploadFile = File(...),
@@ -314,42 +361,11 @@ async def upload_qr_code(
     db: AsyncSession = Depends(get_db),
 ):
     """Upload WeChat QR code image."""
-    # Validate file type
-    if not file.content_type or not file.content_type.startswith("image/"):
-        raise HTTPException(status_code=400, detail="File must be an image (jpg, png, gif, etc.)")
-
-    # Validate file size (5MB limit)
-    max_size = 5 * 1024 * 1024
-    if file.size and file.size > max_size:
-        raise HTTPException(status_code=400, detail="File size must be less than 5MB")
-
-    # Create upload directory
-    upload_dir = Path(settings.upload_dir) / "payment"
-    upload_dir.mkdir(parents=True, exist_ok=True)
-
-    # Generate filename
-    file_extension = "jpg"
-    if file.filename and "." in file.filename:
-        file_extension = file.filename.split(".")[-1]
-    elif file.content_type == "image/png":
-        file_extension = "png"
-
-    filename = f"wechat_qr_{uuid.uuid4().hex}.{file_extension}"
-    file_path = upload_dir / filename
-
-    # Save file
-    try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-    except Exception:
-        raise HTTPException(status_code=500, detail="Failed to save uploaded file")
-    finally:
-        await file.close()
+    filename = await _save_qr_upload(file, "wechat_qr")
 
     # Update payment settings with QR code URL
     qr_code_url = f"{settings.server_url}/{settings.upload_dir}/payment/{filename}"
-    payment_service = PaymentService()
-    payment_settings = await payment_service.update_payment_settings(
+    payment_settings = await _PAYMENT_SERVICE.update_payment_settings(
         db, wechat_qr_code_url=qr_code_url
     )
 
@@ -367,42 +383,11 @@ async def upload_venmo_qr_code(
     db: AsyncSession = Depends(get_db),
 ):
     """Upload Venmo QR code image."""
-    # Validate file type
-    if not file.content_type or not file.content_type.startswith("image/"):
-        raise HTTPException(status_code=400, detail="File must be an image (jpg, png, gif, etc.)")
-
-    # Validate file size (5MB limit)
-    max_size = 5 * 1024 * 1024
-    if file.size and file.size > max_size:
-        raise HTTPException(status_code=400, detail="File size must be less than 5MB")
-
-    # Create upload directory
-    upload_dir = Path(settings.upload_dir) / "payment"
-    upload_dir.mkdir(parents=True, exist_ok=True)
-
-    # Generate filename
-    file_extension = "jpg"
-    if file.filename and "." in file.filename:
-        file_extension = file.filename.split(".")[-1]
-    elif file.content_type == "image/png":
-        file_extension = "png"
-
-    filename = f"venmo_qr_{uuid.uuid4().hex}.{file_extension}"
-    file_path = upload_dir / filename
-
-    # Save file
-    try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-    except Exception:
-        raise HTTPException(status_code=500, detail="Failed to save uploaded file")
-    finally:
-        await file.close()
+    filename = await _save_qr_upload(file, "venmo_qr")
 
     # Update payment settings with Venmo QR code URL
     qr_code_url = f"{settings.server_url}/{settings.upload_dir}/payment/{filename}"
-    payment_service = PaymentService()
-    payment_settings = await payment_service.update_payment_settings(
+    payment_settings = await _PAYMENT_SERVICE.update_payment_settings(
         db, venmo_qr_code_url=qr_code_url
     )
 
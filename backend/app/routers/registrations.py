@@ -1,7 +1,7 @@
 import uuid
 from datetime import date
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -20,27 +20,31 @@ from app.services.tracking_service import TrackingService
 
 router = APIRouter(prefix="/api/registrations", tags=["registrations"])
 
+# The parser and services keep no per-request state, so one instance of each
+# serves every request
+_SCHEDULE_PARSER = ScheduleParserService()
+_REGISTRATION_SERVICE = RegistrationService()
+_NOTIFICATION_SERVICE = NotificationService()
+_PAYMENT_SERVICE = PaymentService()
+_TRACKING_SERVICE = TrackingService()
+
 
 @router.post("/with-schedule", response_model=RegistrationOutWithSchedule, status_code=201)
 async def create_registration_with_schedule(
     data: RegistrationCreateWithSchedule,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """Enhanced registration endpoint with schedule validation."""
-    registration_service = RegistrationService()
-    notification_service = NotificationService()
-    payment_service = PaymentService()
-    tracking_service = TrackingService()
-
     try:
-        registration = await registration_service.create_registration_with_schedule(
+        registration = await _REGISTRATION_SERVICE.create_registration_with_schedule(
             data.model_dump(), db
         )
 
         # Get or create tracking token for the email
-        tracking_token = await tracking_service.get_or_create_token(registration.email, db)
+        tracking_token = await _TRACKING_SERVICE.get_or_create_token(registration.email, db)
         locale = registration.preferred_language or "en"
-        tracking_url = tracking_service.build_tracking_url(tracking_token.token, locale)
+        tracking_url = _TRACKING_SERVICE.build_tracking_url(tracking_token.token, locale)
 
         # Load yoga class for email details
         class_query = select(YogaClass).where(YogaClass.id == data.class_id)
@@ -58,26 +62,32 @@ async def create_registration_with_schedule(
 
         if registration.status == "pending_payment":
             # Create payment record
-            payment = await payment_service.create_payment_for_registration(
+            payment = await _PAYMENT_SERVICE.create_payment_for_registration(
                 registration, yoga_class, db,
                 package_id=data.package_id,
                 payment_method=data.payment_method
             )
 
-            # Send payment instructions email instead of confirmation
+            # Send payment instructions email instead of confirmation, after the response
             if registration.email_notifications:
-                await notification_service.send_payment_pending_email(registration, payment, db, tracking_url=tracking_url, **class_email_kwargs)
+                background_tasks.add_task(
+                    _NOTIFICATION_SERVICE.send_payment_pending_email,
+                    registration, payment, db, tracking_url=tracking_url, **class_email_kwargs
+                )
 
             # Refresh to include payment relationship
             await db.refresh(registration, ["payment"])
         else:
             # Free class — existing flow
             if registration.email_notifications:
-                await notification_service.send_confirmation_email(registration, db, tracking_url=tracking_url, **class_email_kwargs)
+                background_tasks.add_task(
+                    _NOTIFICATION_SERVICE.send_confirmation_email,
+                    registration, db, tracking_url=tracking_url, **class_email_kwargs
+                )
 
         # Schedule reminder if notifications are enabled
         if registration.email_notifications or registration.sms_notifications:
-            await notification_service.schedule_reminder(registration)
+            await _NOTIFICATION_SERVICE.schedule_reminder(registration)
 
         return registration
     except ValueError as e:
@@ -101,27 +111,25 @@ async def get_available_dates(
         raise HTTPException(status_code=404, detail="Class not found")
 
     # Get or ensure schedule data exists
-    registration_service = RegistrationService()
-    schedule_data = await registration_service.ensure_schedule_data_exists(class_id, db)
+    schedule_data = await _REGISTRATION_SERVICE.ensure_schedule_data_exists(class_id, db)
 
     if not schedule_data:
         raise HTTPException(status_code=400, detail="Unable to parse class schedule")
 
     # Get available dates
-    schedule_parser = ScheduleParserService()
-    available_datetimes = schedule_parser.get_next_available_dates(
+    available_datetimes = _SCHEDULE_PARSER.get_next_available_dates(
         schedule_data, from_date, limit
     )
 
+    # Count registrations for every date in one query rather than one per date
+    counts = await _REGISTRATION_SERVICE.get_registration_counts_for_dates(
+        class_id, [dt.date() for dt in available_datetimes], db
+    )
+
     # Format response with capacity information
     available_dates = []
     for dt in available_datetimes:
-        # Check capacity for this date
-        is_available, current_count = await registration_service.validate_registration_capacity(
-            class_id, dt.date(), db
-        )
-
-        available_spots = max(0, yoga_class.capacity - current_count)
+        available_spots = max(0, yoga_class.capacity - counts.get(dt.date(), 0))
 
         available_dates.append(AvailableDateOut(
             date_time=dt,
@@ -140,8 +148,7 @@ async def get_registrations_for_date(
     db: AsyncSession = Depends(get_db)
 ):
     """Get all registrations for a specific class and date."""
-    registration_service = RegistrationService()
-    registrations = await registration_service.get_registrations_for_class_date(
+    registrations = await _REGISTRATION_SERVICE.get_registrations_for_class_date(
         class_id, target_date, db
     )
     return registrations
@@ -1,26 +1,43 @@
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import TTLCache
 from app.database import get_db
 from app.models.teacher import Teacher
 from app.schemas.teacher import TeacherOut
 
 router = APIRouter(prefix="/api/teachers", tags=["teachers"])
 
+# Teachers change rarely; validated responses are reused until a teacher is written
+TEACHERS_TTL_SECONDS = 60
+_teachers_cache = TTLCache(TEACHERS_TTL_SECONDS)
+_teachers_cache.clear_on_write(Teacher)
+
+_TEACHER_LIST_ADAPTER = TypeAdapter(list[TeacherOut])
+
 
 @router.get("", response_model=list[TeacherOut])
 async def list_teachers(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Teacher))
-    return result.scalars().all()
+    teachers = _teachers_cache.get("all")
+    if teachers is None:
+        result = await db.execute(select(Teacher))
+        teachers = _TEACHER_LIST_ADAPTER.validate_python(result.scalars().all())
+        _teachers_cache.set("all", teachers)
+    return teachers
 
 
 @router.get("/{teacher_id}", response_model=TeacherOut)
 async def get_teacher(teacher_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Teacher).where(Teacher.id == teacher_id))
-    teacher = result.scalar_one_or_none()
-    if not teacher:
-        raise HTTPException(status_code=404, detail="Teacher not found")
+    teacher = _teachers_cache.get(teacher_id)
+    if teacher is None:
+        result = await db.execute(select(Teacher).where(Teacher.id == teacher_id))
+        row = result.scalar_one_or_none()
+        if not row:
+            raise HTTPException(status_code=404, detail="Teacher not found")
+        teacher = TeacherOut.model_validate(row)
+        _teachers_cache.set(teacher_id, teacher)
     return teacher
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -16,6 +16,10 @@ from app.services.notification_service import NotificationService
 
 router = APIRouter(prefix="/api/track", tags=["tracking"])
 
+# The services keep no per-request state, so one instance of each serves every request
+_TRACKING_SERVICE = TrackingService()
+_NOTIFICATION_SERVICE = NotificationService()
+
 
 @router.get("/{token}", response_model=TrackingResponse)
 async def get_registrations_by_token(
@@ -23,8 +27,7 @@ async def get_registrations_by_token(
     db: AsyncSession = Depends(get_db),
 ):
     """Look up all registrations for the email associated with this tracking token."""
-    tracking_service = TrackingService()
-    email = await tracking_service.get_email_by_token(token, db)
+    email = await _TRACKING_SERVICE.get_email_by_token(token, db)
 
     if not email:
         raise HTTPException(status_code=404, detail="Invalid tracking link")
@@ -69,18 +72,18 @@ async def get_registrations_by_token(
 @router.post("/request-link")
 async def request_tracking_link(
     data: TrackingLinkRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Request a tracking link to be sent to the given email. Always returns 200."""
-    tracking_service = TrackingService()
-    notification_service = NotificationService()
-
-    token = await tracking_service.get_or_create_token(data.email, db)
-    tracking_url = tracking_service.build_tracking_url(
+    token = await _TRACKING_SERVICE.get_or_create_token(data.email, db)
+    tracking_url = _TRACKING_SERVICE.build_tracking_url(
         token.token, locale=data.preferred_language
     )
 
-    await notification_service.send_tracking_link_email(
+    # Sent after the response, which also keeps its timing independent of SMTP
+    background_tasks.add_task(
+        _NOTIFICATION_SERVICE.send_tracking_link_email,
         data.email, tracking_url, data.preferred_language, db
     )
 
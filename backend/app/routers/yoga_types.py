@@ -1,26 +1,43 @@
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import TTLCache
 from app.database import get_db
 from app.models.yoga_type import YogaType
 from app.schemas.yoga_type import YogaTypeOut
 
 router = APIRouter(prefix="/api/yoga-types", tags=["yoga-types"])
 
+# Yoga types change rarely; validated responses are reused until a type is written
+YOGA_TYPES_TTL_SECONDS = 60
+_yoga_types_cache = TTLCache(YOGA_TYPES_TTL_SECONDS)
+_yoga_types_cache.clear_on_write(YogaType)
+
+_YOGA_TYPE_LIST_ADAPTER = TypeAdapter(list[YogaTypeOut])
+
 
 @router.get("", response_model=list[YogaTypeOut])
 async def list_yoga_types(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(YogaType))
-    return result.scalars().all()
+    yoga_types = _yoga_types_cache.get("all")
+    if yoga_types is None:
+        result = await db.execute(select(YogaType))
+        yoga_types = _YOGA_TYPE_LIST_ADAPTER.validate_python(result.scalars().all())
+        _yoga_types_cache.set("all", yoga_types)
+    return yoga_types
 
 
 @router.get("/{yoga_type_id}", response_model=YogaTypeOut)
 async def get_yoga_type(yoga_type_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(YogaType).where(YogaType.id == yoga_type_id))
-    yoga_type = result.scalar_one_or_none()
-    if not yoga_type:
-        raise HTTPException(status_code=404, detail="Yoga type not found")
+    yoga_type = _yoga_types_cache.get(yoga_type_id)
+    if yoga_type is None:
+        result = await db.execute(select(YogaType).where(YogaType.id == yoga_type_id))
+        row = result.scalar_one_or_none()
+        if not row:
+            raise HTTPException(status_code=404, detail="Yoga type not found")
+        yoga_type = YogaTypeOut.model_validate(row)
+        _yoga_types_cache.set(yoga_type_id, yoga_type)
     return yoga_type
@@ -2,7 +2,10 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
+
+# Upper bound on registrations touched by a single bulk status request
+BULK_STATUS_MAX_IDS = 500
 
 
 class AdminLoginSchema(BaseModel):
@@ -31,6 +34,15 @@ class RegistrationStatusUpdate(BaseModel):
     status: str  # confirmed, waitlist, cancelled
 
 
+class RegistrationBulkStatusUpdate(BaseModel):
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=BULK_STATUS_MAX_IDS)
+    status: str
+
+
+class RegistrationBulkStatusOut(BaseModel):
+    updated: list[uuid.UUID]
+
+
 class AdminStatsOut(BaseModel):
     total_registrations: int
     total_teachers: int
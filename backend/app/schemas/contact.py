@@ -1,7 +1,11 @@
 import uuid
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, EmailStr
+from typing import Literal, Optional, List
+from pydantic import BaseModel, EmailStr, TypeAdapter
+
+# Values accepted by the admin inquiry list filters
+InquiryStatus = Literal["open", "in_progress", "resolved", "closed"]
+InquiryCategory = Literal["scheduling", "general", "business"]
 
 
 class ContactInquiryCreate(BaseModel):
@@ -76,4 +80,7 @@ class InquiryReplyOut(BaseModel):
 
 
 # Forward reference resolution
-ContactInquiryOut.model_rebuild()
\ No newline at end of file
+ContactInquiryOut.model_rebuild()
+
+# Validate and serialize the admin inquiry list in one call
+INQUIRY_SUMMARY_LIST_ADAPTER = TypeAdapter(list[ContactInquirySummary])
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 class ClassPackageCreate(BaseModel):
@@ -117,3 +117,8 @@ class PaymentStatsOut(BaseModel):
     total_revenue: float
     total_revenue_cny: float = 0.0
     total_revenue_usd: float = 0.0
+
+
+# Validate whole lists of ORM rows in one call instead of one model_validate per row
+PAYMENT_LIST_ADAPTER = TypeAdapter(list[PaymentOut])
+PACKAGE_LIST_ADAPTER = TypeAdapter(list[ClassPackageOut])
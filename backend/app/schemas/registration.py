@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime, date, time
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, TypeAdapter
 from app.schemas.payment import PaymentOut
 
 
@@ -49,6 +49,10 @@ class RegistrationOutWithSchedule(BaseModel):
     model_config = {"from_attributes": True}
 
 
+# Validates a whole list of ORM rows in one call instead of one model_validate per row
+REGISTRATION_LIST_ADAPTER = TypeAdapter(list[RegistrationOutWithSchedule])
+
+
 class AvailableDateOut(BaseModel):
     """Schema for available class dates."""
     date_time: datetime
@@ -2,7 +2,7 @@ import uuid
 from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, and_, func
+from sqlalchemy import select, desc, and_, func, tuple_
 from sqlalchemy.orm import selectinload
 
 from app.models.consent_record import ConsentRecord
@@ -48,7 +48,6 @@ class ConsentService:
         )
         db.add(record)
         await db.commit()
-        await db.refresh(record)
         return record
 
     async def get_all_consents(
@@ -58,12 +57,17 @@ class ConsentService:
         yoga_type_id: Optional[uuid.UUID] = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[uuid.UUID] = None,
     ) -> List[ConsentRecord]:
-        """Get all consent records with optional filtering."""
+        """Get all consent records with optional filtering, newest first.
+
+        Pass the id of the last record of the previous page as `cursor` to page
+        with an index range scan instead of an OFFSET.
+        """
         query = (
             select(ConsentRecord)
             .options(selectinload(ConsentRecord.yoga_type))
-            .order_by(desc(ConsentRecord.signed_at))
+            .order_by(desc(ConsentRecord.signed_at), desc(ConsentRecord.id))
         )
 
         conditions = []
@@ -71,6 +75,13 @@ class ConsentService:
             conditions.append(ConsentRecord.email == email.lower().strip())
         if yoga_type_id:
             conditions.append(ConsentRecord.yoga_type_id == yoga_type_id)
+        if cursor is not None:
+            anchor = (
+                select(ConsentRecord.signed_at, ConsentRecord.id)
+                .where(ConsentRecord.id == cursor)
+                .scalar_subquery()
+            )
+            conditions.append(tuple_(ConsentRecord.signed_at, ConsentRecord.id) < anchor)
 
         if conditions:
             query = query.where(and_(*conditions))
@@ -81,33 +92,26 @@ class ConsentService:
 
     async def get_consent_stats(self, db: AsyncSession) -> dict:
         """Get consent statistics grouped by yoga type."""
-        # Total count
-        total_query = select(func.count(ConsentRecord.id))
-        total_result = await db.execute(total_query)
-        total = total_result.scalar() or 0
-
-        # Count by yoga type
-        yoga_types_query = select(YogaType)
-        yoga_types_result = await db.execute(yoga_types_query)
-        yoga_types = yoga_types_result.scalars().all()
+        # One grouped query instead of a COUNT per yoga type. Every consent
+        # references a yoga type, so the total is the sum of the groups.
+        query = (
+            select(YogaType.id, YogaType.name_en, YogaType.name_zh, func.count(ConsentRecord.id))
+            .outerjoin(ConsentRecord, ConsentRecord.yoga_type_id == YogaType.id)
+            .group_by(YogaType.id, YogaType.name_en, YogaType.name_zh)
+        )
+        result = await db.execute(query)
 
-        by_yoga_type = []
-        for yt in yoga_types:
-            count_query = select(func.count(ConsentRecord.id)).where(
-                ConsentRecord.yoga_type_id == yt.id
-            )
-            count_result = await db.execute(count_query)
-            count = count_result.scalar() or 0
-            by_yoga_type.append(
-                {
-                    "yoga_type_id": str(yt.id),
-                    "name_en": yt.name_en,
-                    "name_zh": yt.name_zh,
-                    "count": count,
-                }
-            )
+        by_yoga_type = [
+            {
+                "yoga_type_id": str(yoga_type_id),
+                "name_en": name_en,
+                "name_zh": name_zh,
+                "count": count,
+            }
+            for yoga_type_id, name_en, name_zh, count in result
+        ]
 
         return {
-            "total": total,
+            "total": sum(item["count"] for item in by_yoga_type),
             "by_yoga_type": by_yoga_type,
         }
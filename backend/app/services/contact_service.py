@@ -3,7 +3,7 @@ from typing import List, Optional
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, selectinload
 
 from app.models.contact_inquiry import ContactInquiry
 from app.models.inquiry_reply import InquiryReply
@@ -39,7 +39,12 @@ class ContactService:
         offset: int = 0
     ) -> List[ContactInquiry]:
         """Get all contact inquiries with optional filtering."""
-        query = select(ContactInquiry).order_by(desc(ContactInquiry.created_at))
+        # The summary view never shows the free-text bodies, so leave them out of the SELECT
+        query = (
+            select(ContactInquiry)
+            .options(defer(ContactInquiry.message), defer(ContactInquiry.admin_notes))
+            .order_by(desc(ContactInquiry.created_at))
+        )
 
         # Apply filters
         conditions = []
@@ -71,7 +76,6 @@ class ContactService:
             setattr(inquiry, field, value)
 
         await db.commit()
-        await db.refresh(inquiry)
         return inquiry
 
     async def get_inquiry_stats(self, db: AsyncSession) -> dict:
@@ -114,7 +118,6 @@ class ContactService:
         )
         db.add(reply)
         await db.commit()
-        await db.refresh(reply)
         return reply
 
     async def update_reply_status(
@@ -140,5 +143,4 @@ class ContactService:
             reply.sent_at = datetime.utcnow()
 
         await db.commit()
-        await db.refresh(reply)
         return reply
\ No newline at end of file
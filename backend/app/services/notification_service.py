@@ -1,5 +1,7 @@
+import asyncio
 import uuid
 import json
+from typing import List, Optional
 import aiosmtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -115,11 +117,35 @@ class NotificationService:
             print(f"Error sending confirmation email: {e}")
             return False
 
+    async def send_inquiry_notifications(self, inquiry: ContactInquiry, db: AsyncSession) -> List[bool]:
+        """Send the inquiry confirmation to the user and the notification to the admin.
+
+        The session can only run one query at a time, so both templates are read
+        first and just the two SMTP sends run concurrently.
+        """
+        try:
+            confirmation_template = await self._get_template("inquiry_confirmation", "email", db)
+            admin_template = await self._get_template("admin_inquiry_notification", "email", db)
+        except Exception as e:
+            print(f"Error loading inquiry email templates: {e}")
+            return [False, False]
+
+        return await asyncio.gather(
+            self._send_inquiry_confirmation(inquiry, confirmation_template),
+            self._send_admin_inquiry_notification(inquiry, admin_template),
+        )
+
     async def send_inquiry_confirmation_email(self, inquiry: ContactInquiry, db: AsyncSession) -> bool:
         """Send contact inquiry confirmation email to user."""
         try:
-            # Get email template
             template = await self._get_template("inquiry_confirmation", "email", db)
+        except Exception as e:
+            print(f"Error sending inquiry confirmation email: {e}")
+            return False
+        return await self._send_inquiry_confirmation(inquiry, template)
+
+    async def _send_inquiry_confirmation(self, inquiry: ContactInquiry, template: Optional[NotificationTemplate]) -> bool:
+        try:
             if not template:
                 print(f"No email template found for inquiry confirmation")
                 return False
@@ -168,8 +194,14 @@ class NotificationService:
     async def send_admin_inquiry_notification(self, inquiry: ContactInquiry, db: AsyncSession) -> bool:
         """Send notification to admin about new contact inquiry."""
         try:
-            # Get email template
             template = await self._get_template("admin_inquiry_notification", "email", db)
+        except Exception as e:
+            print(f"Error sending admin inquiry notification: {e}")
+            return False
+        return await self._send_admin_inquiry_notification(inquiry, template)
+
+    async def _send_admin_inquiry_notification(self, inquiry: ContactInquiry, template: Optional[NotificationTemplate]) -> bool:
+        try:
             if not template:
                 print(f"No email template found for admin inquiry notification")
                 return False
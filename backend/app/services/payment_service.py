@@ -6,7 +6,8 @@ from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, and_, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.models.payment import Payment
 from app.models.payment_settings import PaymentSettings
@@ -16,6 +17,10 @@ from app.models.yoga_class import YogaClass
 from app.schemas.payment import ClassPackageCreate, ClassPackageUpdate
 
 
+# Attempts at drawing a reference number that is not already taken
+REFERENCE_NUMBER_ATTEMPTS = 5
+
+
 class PaymentService:
     """Service for handling payment operations."""
 
@@ -75,32 +80,29 @@ class PaymentService:
                 currency = yoga_class.currency
             payment_type = "single_session"
 
-        # Generate unique reference number
-        reference_number = self.generate_reference_number()
-        # Ensure uniqueness
-        while True:
-            existing = await db.execute(
-                select(Payment).where(Payment.reference_number == reference_number)
+        # The unique constraint on reference_number catches the rare collision; the
+        # insert is retried inside a savepoint instead of checking with a SELECT first
+        for attempt in range(REFERENCE_NUMBER_ATTEMPTS):
+            payment = Payment(
+                registration_id=registration.id,
+                amount=amount,
+                currency=currency,
+                payment_method=payment_method,
+                status="pending",
+                reference_number=self.generate_reference_number(),
+                payment_type=payment_type,
+                package_id=package_id,
             )
-            if not existing.scalar_one_or_none():
+            try:
+                async with db.begin_nested():
+                    db.add(payment)
+                    await db.flush()
                 break
-            reference_number = self.generate_reference_number()
-
-        payment = Payment(
-            id=uuid.uuid4(),
-            registration_id=registration.id,
-            amount=amount,
-            currency=currency,
-            payment_method=payment_method,
-            status="pending",
-            reference_number=reference_number,
-            payment_type=payment_type,
-            package_id=package_id,
-        )
+            except IntegrityError:
+                if attempt == REFERENCE_NUMBER_ATTEMPTS - 1:
+                    raise
 
-        db.add(payment)
         await db.commit()
-        await db.refresh(payment)
         return payment
 
     async def confirm_payment(
@@ -110,8 +112,16 @@ class PaymentService:
         db: AsyncSession,
         notes: Optional[str] = None
     ) -> Payment:
-        """Confirm a payment and update the associated registration."""
-        query = select(Payment).where(Payment.id == payment_id)
+        """Confirm a payment and update the associated registration.
+
+        The registration and its class are joined into the same query, so callers
+        can email the registrant without loading them again.
+        """
+        query = (
+            select(Payment)
+            .where(Payment.id == payment_id)
+            .options(joinedload(Payment.registration).joinedload(Registration.yoga_class))
+        )
         result = await db.execute(query)
         payment = result.scalar_one_or_none()
 
@@ -125,15 +135,10 @@ class PaymentService:
             payment.admin_notes = notes
 
         # Update associated registration status
-        if payment.registration_id:
-            reg_query = select(Registration).where(Registration.id == payment.registration_id)
-            reg_result = await db.execute(reg_query)
-            registration = reg_result.scalar_one_or_none()
-            if registration:
-                registration.status = "confirmed"
+        if payment.registration:
+            payment.registration.status = "confirmed"
 
         await db.commit()
-        await db.refresh(payment)
         return payment
 
     async def cancel_payment(
@@ -163,7 +168,6 @@ class PaymentService:
                 registration.status = "cancelled"
 
         await db.commit()
-        await db.refresh(payment)
         return payment
 
     async def get_payment_by_id(self, payment_id: uuid.UUID, db: AsyncSession) -> Optional[Payment]:
@@ -207,41 +211,39 @@ class PaymentService:
         result = await db.execute(query)
         return list(result.scalars().all())
 
+    @staticmethod
+    def payment_stats_query():
+        """Single-row SELECT of payment status counts and confirmed revenue."""
+        is_confirmed = Payment.status == "confirmed"
+
+        # Filtered aggregates over one scan of payments
+        return select(
+            func.count().label("total"),
+            func.count().filter(Payment.status == "pending").label("pending"),
+            func.count().filter(is_confirmed).label("confirmed"),
+            func.count().filter(Payment.status == "cancelled").label("cancelled"),
+            func.coalesce(func.sum(Payment.amount).filter(is_confirmed), 0).label("revenue"),
+            func.coalesce(
+                func.sum(Payment.amount).filter(and_(is_confirmed, Payment.currency == "CNY")), 0
+            ).label("revenue_cny"),
+            func.coalesce(
+                func.sum(Payment.amount).filter(and_(is_confirmed, Payment.currency == "USD")), 0
+            ).label("revenue_usd"),
+        ).select_from(Payment)
+
     async def get_payment_stats(self, db: AsyncSession) -> dict:
         """Get payment statistics for dashboard."""
-        # Count by status
-        total_query = select(func.count(Payment.id))
-        pending_query = select(func.count(Payment.id)).where(Payment.status == "pending")
-        confirmed_query = select(func.count(Payment.id)).where(Payment.status == "confirmed")
-        cancelled_query = select(func.count(Payment.id)).where(Payment.status == "cancelled")
-
-        # Total revenue (confirmed payments only)
-        revenue_query = select(func.coalesce(func.sum(Payment.amount), 0)).where(Payment.status == "confirmed")
-
-        # Per-currency revenue
-        revenue_cny_query = select(func.coalesce(func.sum(Payment.amount), 0)).where(
-            and_(Payment.status == "confirmed", Payment.currency == "CNY")
-        )
-        revenue_usd_query = select(func.coalesce(func.sum(Payment.amount), 0)).where(
-            and_(Payment.status == "confirmed", Payment.currency == "USD")
-        )
-
-        total = (await db.execute(total_query)).scalar() or 0
-        pending = (await db.execute(pending_query)).scalar() or 0
-        confirmed = (await db.execute(confirmed_query)).scalar() or 0
-        cancelled = (await db.execute(cancelled_query)).scalar() or 0
-        revenue = float((await db.execute(revenue_query)).scalar() or 0)
-        revenue_cny = float((await db.execute(revenue_cny_query)).scalar() or 0)
-        revenue_usd = float((await db.execute(revenue_usd_query)).scalar() or 0)
+        stats_query = self.payment_stats_query()
+        row = (await db.execute(stats_query)).one()
 
         return {
-            "total_payments": total,
-            "pending_payments": pending,
-            "confirmed_payments": confirmed,
-            "cancelled_payments": cancelled,
-            "total_revenue": revenue,
-            "total_revenue_cny": revenue_cny,
-            "total_revenue_usd": revenue_usd,
+            "total_payments": row.total,
+            "pending_payments": row.pending,
+            "confirmed_payments": row.confirmed,
+            "cancelled_payments": row.cancelled,
+            "total_revenue": float(row.revenue),
+            "total_revenue_cny": float(row.revenue_cny),
+            "total_revenue_usd": float(row.revenue_usd),
         }
 
     # Package CRUD
@@ -250,7 +252,6 @@ class PaymentService:
         package = ClassPackage(**package_data.model_dump())
         db.add(package)
         await db.commit()
-        await db.refresh(package)
         return package
 
     async def update_package(
@@ -272,7 +273,6 @@ class PaymentService:
             setattr(package, field, value)
 
         await db.commit()
-        await db.refresh(package)
         return package
 
     async def get_packages_for_class(self, class_id: uuid.UUID, db: AsyncSession) -> List[ClassPackage]:
@@ -302,7 +302,7 @@ class PaymentService:
         settings = await self.get_payment_settings(db)
 
         if not settings:
-            settings = PaymentSettings(id=uuid.uuid4())
+            settings = PaymentSettings()
             db.add(settings)
 
         if wechat_qr_code_url is not None:
@@ -319,5 +319,4 @@ class PaymentService:
             settings.venmo_payment_instructions_zh = venmo_payment_instructions_zh
 
         await db.commit()
-        await db.refresh(settings)
         return settings
@@ -1,7 +1,6 @@
-import json
 import uuid
 from datetime import date, time
-from typing import Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
@@ -10,6 +9,9 @@ from app.models.registration import Registration
 from app.models.yoga_class import YogaClass
 from app.services.schedule_parser import ScheduleParserService
 
+# Registrations that take up a spot in a class
+CAPACITY_STATUSES = ("confirmed", "waitlist", "pending_payment")
+
 
 class RegistrationService:
     """
@@ -58,18 +60,10 @@ class RegistrationService:
 
         # Validate schedule if target_date is provided
         if target_date:
-            # Parse schedule data
-            schedule_data = {}
-            if yoga_class.schedule_data:
-                try:
-                    schedule_data = json.loads(yoga_class.schedule_data)
-                except json.JSONDecodeError:
-                    # If schedule_data is malformed, parse from schedule string
-                    schedule_data = self.schedule_parser.parse_schedule_string(
-                        yoga_class.schedule
-                    )
-            else:
-                # If schedule_data is NULL, parse from schedule string
+            # Use the stored schedule structure, re-parsing the schedule string
+            # if it is missing or malformed
+            schedule_data = yoga_class.schedule_data
+            if not schedule_data or not isinstance(schedule_data, dict):
                 schedule_data = self.schedule_parser.parse_schedule_string(
                     yoga_class.schedule
                 )
@@ -109,7 +103,6 @@ class RegistrationService:
 
         # Create the registration
         registration = Registration(
-            id=uuid.uuid4(),
             class_id=class_id,
             name=registration_data["name"],
             email=registration_data["email"],
@@ -120,12 +113,13 @@ class RegistrationService:
             preferred_language=registration_data.get("preferred_language", "en"),
             email_notifications=registration_data.get("email_notifications", True),
             sms_notifications=registration_data.get("sms_notifications", False),
-            status=initial_status
+            status=initial_status,
+            # Nothing to lazy-load for a brand new registration
+            payment=None,
         )
 
         db.add(registration)
         await db.commit()
-        await db.refresh(registration)
 
         return registration
 
@@ -158,7 +152,7 @@ class RegistrationService:
         registration_query = select(func.count(Registration.id)).where(
             Registration.class_id == class_id,
             Registration.target_date == target_date,
-            Registration.status.in_(["confirmed", "waitlist", "pending_payment"])
+            Registration.status.in_(CAPACITY_STATUSES)
         )
 
         result = await db.execute(registration_query)
@@ -169,6 +163,39 @@ class RegistrationService:
 
         return is_available, current_count
 
+    async def get_registration_counts_for_dates(
+        self,
+        class_id: uuid.UUID,
+        target_dates: List[date],
+        db: AsyncSession
+    ) -> Dict[date, int]:
+        """
+        Count the registrations holding a spot on each of several dates in one query.
+
+        Args:
+            class_id: UUID of the yoga class
+            target_dates: Dates to count registrations for
+            db: Database session
+
+        Returns:
+            Mapping of date to registration count; dates without registrations are omitted
+        """
+        if not target_dates:
+            return {}
+
+        count_query = (
+            select(Registration.target_date, func.count(Registration.id))
+            .where(
+                Registration.class_id == class_id,
+                Registration.target_date.in_(target_dates),
+                Registration.status.in_(CAPACITY_STATUSES)
+            )
+            .group_by(Registration.target_date)
+        )
+
+        result = await db.execute(count_query)
+        return {target_date: count for target_date, count in result.all()}
+
     async def get_registration_by_id(
         self,
         registration_id: uuid.UUID,
@@ -214,7 +241,6 @@ class RegistrationService:
 
         registration.status = new_status
         await db.commit()
-        await db.refresh(registration)
 
         return registration
 
@@ -266,12 +292,9 @@ class RegistrationService:
         if not yoga_class:
             return None
 
-        # If schedule_data already exists and is valid JSON, return it
-        if yoga_class.schedule_data:
-            try:
-                return json.loads(yoga_class.schedule_data)
-            except json.JSONDecodeError:
-                pass  # Continue to parse from schedule string
+        # If schedule_data already exists and is a schedule structure, return it
+        if yoga_class.schedule_data and isinstance(yoga_class.schedule_data, dict):
+            return yoga_class.schedule_data
 
         # Parse from schedule string
         parsed_schedule = self.schedule_parser.parse_schedule_string(
@@ -279,7 +302,7 @@ class RegistrationService:
         )
 
         # Update the class with structured schedule data
-        yoga_class.schedule_data = json.dumps(parsed_schedule)
+        yoga_class.schedule_data = parsed_schedule
         await db.commit()
 
         return parsed_schedule
\ No newline at end of file
@@ -29,6 +29,44 @@ class ScheduleParserService:
         r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun)(/(Mon|Tue|Wed|Thu|Fri|Sat|Sun))* \d{1,2}:\d{2} (AM|PM)$'
     )
 
+    # Day name/abbreviation → canonical 3-letter abbreviation
+    DAY_NAME_ABBREVS = {
+        'monday': 'Mon', 'mon': 'Mon',
+        'tuesday': 'Tue', 'tue': 'Tue', 'tues': 'Tue',
+        'wednesday': 'Wed', 'wed': 'Wed',
+        'thursday': 'Thu', 'thu': 'Thu', 'thurs': 'Thu',
+        'friday': 'Fri', 'fri': 'Fri',
+        'saturday': 'Sat', 'sat': 'Sat',
+        'sunday': 'Sun', 'sun': 'Sun',
+    }
+
+    # Days + time in one regex.  Days may be separated by / or ,
+    # Time may be 12h (with AM/PM) or 24h, optionally followed by a range end.
+    NORMALIZE_RE = re.compile(
+        r'(?i)'
+        r'([a-z/,\s]+?)'           # days (greedy but lazy enough)
+        r'\s+'
+        r'(\d{1,2}:\d{2})'         # start time HH:MM
+        r'\s*'
+        r'(?:[APap][Mm])?'          # optional AM/PM on start
+        r'(?:\s*-\s*\d{1,2}:\d{2}(?:\s*[APap][Mm])?)?'  # optional range end
+        r'\s*'
+        r'([APap][Mm])?'            # trailing AM/PM (covers "7:00 AM" where AM is after space)
+        r'\s*$'
+    )
+    AMPM_RE = re.compile(r'(?i)([ap]m)')
+    DAY_SEPARATOR_RE = re.compile(r'[/,]+')
+
+    # Patterns for parse_schedule_string, in order of specificity (most specific first)
+    SCHEDULE_PATTERNS = [
+        # Pattern 0: "Wednesday 18:00 - 19:30" (with duration) - most specific
+        re.compile(r'([a-z/]+)\s+(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})'),
+        # Pattern 1: "Mon/Wed/Fri 7:00 AM" or "Monday/Wednesday 9:30 PM"
+        re.compile(r'([a-z/]+)\s+(\d{1,2}):(\d{2})\s*(am|pm)'),
+        # Pattern 2: "Mon/Wed/Fri 19:00" (24-hour format) - least specific
+        re.compile(r'([a-z/]+)\s+(\d{1,2}):(\d{2})\s*$'),
+    ]
+
     @staticmethod
     def normalize_schedule(schedule: str) -> str:
         """
@@ -46,36 +84,7 @@ class ScheduleParserService:
 
         text = schedule.strip()
 
-        # --- parse days portion ---------------------------------------------------
-        # Collect known day tokens from the leading part of the string.
-        # We split on ``/`` or ``,`` (with optional surrounding whitespace), and also
-        # allow bare whitespace separation *only* when day names are full-length so
-        # that the time part is not accidentally consumed.
-        day_name_map = {
-            'monday': 'Mon', 'mon': 'Mon',
-            'tuesday': 'Tue', 'tue': 'Tue', 'tues': 'Tue',
-            'wednesday': 'Wed', 'wed': 'Wed',
-            'thursday': 'Thu', 'thu': 'Thu', 'thurs': 'Thu',
-            'friday': 'Fri', 'fri': 'Fri',
-            'saturday': 'Sat', 'sat': 'Sat',
-            'sunday': 'Sun', 'sun': 'Sun',
-        }
-
-        # Try to match days + time in one regex.  Days may be separated by / or ,
-        # Time may be 12h (with AM/PM) or 24h, optionally followed by a range end.
-        m = re.match(
-            r'(?i)'
-            r'([a-z/,\s]+?)'           # days (greedy but lazy enough)
-            r'\s+'
-            r'(\d{1,2}:\d{2})'         # start time HH:MM
-            r'\s*'
-            r'(?:[APap][Mm])?'          # optional AM/PM on start
-            r'(?:\s*-\s*\d{1,2}:\d{2}(?:\s*[APap][Mm])?)?'  # optional range end
-            r'\s*'
-            r'([APap][Mm])?'            # trailing AM/PM (covers "7:00 AM" where AM is after space)
-            r'\s*$',
-            text,
-        )
+        m = ScheduleParserService.NORMALIZE_RE.match(text)
 
         if not m:
             return schedule  # can't parse – return as-is
@@ -84,16 +93,16 @@ class ScheduleParserService:
         time_raw = m.group(2)
 
         # Determine AM/PM.  Check original string for any AM/PM token.
-        ampm_match = re.search(r'(?i)([ap]m)', text)
+        ampm_match = ScheduleParserService.AMPM_RE.search(text)
         ampm_token = ampm_match.group(1).upper() if ampm_match else None
 
         # Parse individual day tokens
-        tokens = re.split(r'[/,]+', days_raw)
+        tokens = ScheduleParserService.DAY_SEPARATOR_RE.split(days_raw)
         day_abbrevs = []
         for tok in tokens:
             tok = tok.strip().lower()
-            if tok in day_name_map:
-                day_abbrevs.append(day_name_map[tok])
+            if tok in ScheduleParserService.DAY_NAME_ABBREVS:
+                day_abbrevs.append(ScheduleParserService.DAY_NAME_ABBREVS[tok])
 
         if not day_abbrevs:
             return schedule  # no recognisable days
@@ -151,20 +160,10 @@ class ScheduleParserService:
 
         schedule = schedule.strip().lower()
 
-        # Try multiple patterns in order of specificity (most specific first)
-        patterns = [
-            # Pattern 0: "Wednesday 18:00 - 19:30" (with duration) - most specific
-            r'([a-z/]+)\s+(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})',
-            # Pattern 1: "Mon/Wed/Fri 7:00 AM" or "Monday/Wednesday 9:30 PM"
-            r'([a-z/]+)\s+(\d{1,2}):(\d{2})\s*(am|pm)',
-            # Pattern 2: "Mon/Wed/Fri 19:00" (24-hour format) - least specific
-            r'([a-z/]+)\s+(\d{1,2}):(\d{2})\s*$'
-        ]
-
         match = None
         pattern_type = None
-        for i, pattern in enumerate(patterns):
-            match = re.search(pattern, schedule)
+        for i, pattern in enumerate(self.SCHEDULE_PATTERNS):
+            match = pattern.search(schedule)
             if match:
                 pattern_type = i
                 break
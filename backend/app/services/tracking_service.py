@@ -21,7 +21,6 @@ class TrackingService:
         token = TrackingToken(email=normalized)
         db.add(token)
         await db.commit()
-        await db.refresh(token)
         return token
 
     async def get_email_by_token(self, token: str, db: AsyncSession) -> str | None:
@@ -0,0 +1,133 @@
+import asyncio
+import hashlib
+import os
+import re
+import secrets
+from pathlib import Path
+
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+
+# Bytes read from the upload and written to disk per step
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Largest image accepted by the upload endpoints
+MAX_IMAGE_SIZE = 5 * 1024 * 1024
+
+# Slack for the multipart boundary and part headers wrapped around the file
+MULTIPART_OVERHEAD = 64 * 1024
+
+# Image upload endpoints whose request size is checked before the body is read
+IMAGE_UPLOAD_PATH = re.compile(r"/api/admin/(teachers/[^/]+/photo|payment-settings/(venmo-)?qr-code)")
+
+# Teacher photos live here; created once at import time by app.main
+TEACHER_PHOTO_DIR = Path("uploads") / "teachers"
+
+# Leading bytes of the accepted image formats, mapped to the extension to store them under
+IMAGE_SIGNATURES = {
+    b"\xff\xd8\xff": "jpg",
+    b"\x89PNG\r\n\x1a\n": "png",
+    b"GIF87a": "gif",
+    b"GIF89a": "gif",
+}
+
+
+async def sniff_image_extension(file: UploadFile) -> str | None:
+    """Return the file extension for an uploaded image, judged by its magic bytes.
+
+    The client-supplied content type and filename are not consulted. Returns None
+    if the upload is not a JPEG, PNG, GIF or WebP image. The file is rewound
+    afterwards.
+    """
+    header = await file.read(12)
+    await file.seek(0)
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "webp"
+    for signature, extension in IMAGE_SIGNATURES.items():
+        if header.startswith(signature):
+            return extension
+    return None
+
+
+def unique_upload_name(prefix: str, extension: str) -> str:
+    """Return a collision-resistant filename such as `<prefix>_<random token>.<extension>`."""
+    return f"{prefix}_{secrets.token_urlsafe(12)}.{extension}"
+
+
+def _write_chunk(buffer, chunk: bytes, digest) -> None:
+    buffer.write(chunk)
+    if digest is not None:
+        digest.update(chunk)
+
+
+async def save_upload(file: UploadFile, path: Path, max_size: int, digest=None) -> int:
+    """Stream an uploaded file to `path` without blocking the event loop.
+
+    The file is read in chunks and each disk write runs in a worker thread. The
+    size limit is enforced on the bytes actually received rather than on the
+    client-declared size; an oversized upload is aborted, its partial file removed
+    and a 400 raised. If a hashlib `digest` is given it is fed every chunk in the
+    same worker thread. Returns the number of bytes written.
+    """
+    written = 0
+    buffer = await asyncio.to_thread(open, path, "wb")
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            written += len(chunk)
+            if written > max_size:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"File size must be less than {max_size // (1024 * 1024)}MB"
+                )
+            await asyncio.to_thread(_write_chunk, buffer, chunk, digest)
+    except BaseException:
+        await asyncio.to_thread(buffer.close)
+        await asyncio.to_thread(path.unlink, missing_ok=True)
+        raise
+    await asyncio.to_thread(buffer.close)
+    return written
+
+
+async def save_upload_by_content(file: UploadFile, directory: Path, extension: str, max_size: int) -> str:
+    """Stream an upload into `directory` under a name derived from its SHA-256.
+
+    Identical uploads end up at the same path, so re-uploading a photo reuses the
+    stored file instead of adding another copy. The bytes go to a temporary file
+    first and are renamed into place atomically. Returns the stored filename.
+    """
+    digest = hashlib.sha256()
+    temp_path = directory / f".{secrets.token_urlsafe(12)}.part"
+    await save_upload(file, temp_path, max_size, digest)
+    filename = f"{digest.hexdigest()[:32]}.{extension}"
+    try:
+        await asyncio.to_thread(os.replace, temp_path, directory / filename)
+    except BaseException:
+        await asyncio.to_thread(temp_path.unlink, missing_ok=True)
+        raise
+    return filename
+
+
+class UploadSizeLimitMiddleware:
+    """Answer 413 for image uploads whose declared Content-Length is already too large.
+
+    Runs before the multipart body is spooled to a temporary file. Uploads sent
+    without a Content-Length are still capped while streaming by save_upload.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.max_body_size = MAX_IMAGE_SIZE + MULTIPART_OVERHEAD
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "POST" and IMAGE_UPLOAD_PATH.fullmatch(scope["path"]):
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_body_size:
+                        response = JSONResponse(
+                            status_code=413,
+                            content={"detail": f"File size must be less than {MAX_IMAGE_SIZE // (1024 * 1024)}MB"},
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
@@ -9,7 +9,7 @@ from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
 from app.models.admin_user import AdminUser
-import hashlib
+from app.auth import get_password_hash
 from app.services.notification_service import NotificationService
 
 async def create_admin_user(db: AsyncSession):
@@ -24,13 +24,11 @@ async def create_admin_user(db: AsyncSession):
         print(f"Admin user already exists: {existing_admin.username}")
         return existing_admin
 
-    # Create new admin user with temporary simple hash
-    # TODO: Fix bcrypt integration for production
-    simple_hash = hashlib.sha256("admin123".encode()).hexdigest()
+    # Create new admin user
     admin_user = AdminUser(
         username="admin",
         email="admin@enjoyyoga.com",
-        hashed_password=simple_hash,
+        hashed_password=get_password_hash("admin123"),
         role="super_admin"
     )
 
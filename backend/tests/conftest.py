@@ -61,6 +61,26 @@ async def db_session(db_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
+@pytest.fixture(autouse=True)
+def clear_auth_cache():
+    """Ensure cached admin lookups never leak between tests."""
+    from app.auth import clear_admin_cache
+
+    clear_admin_cache()
+    yield
+    clear_admin_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_response_caches():
+    """Ensure cached responses never leak between tests."""
+    from app.cache import clear_all_caches
+
+    clear_all_caches()
+    yield
+    clear_all_caches()
+
+
 @pytest.fixture
 def temp_upload_dir() -> Generator[Path, None, None]:
     """Create temporary upload directory for tests."""
@@ -96,6 +96,33 @@ class TestAdminRouter:
         assert data["email"] == admin_user_in_db.email
         assert data["role"] == admin_user_in_db.role
 
+    @pytest.mark.unit
+    async def test_get_current_admin_is_cached_per_token(
+        self,
+        client: AsyncClient,
+        db_session,
+        admin_user_in_db: AdminUser,
+    ):
+        """Test that a resolved admin is reused for the same token until the cache is cleared."""
+        from app.auth import clear_admin_cache
+
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await client.get("/api/admin/me", headers=headers)
+        assert response.status_code == 200
+
+        # Deactivation is only observed once the cached entry is gone
+        admin_user_in_db.is_active = False
+        await db_session.commit()
+
+        response = await client.get("/api/admin/me", headers=headers)
+        assert response.status_code == 200
+
+        clear_admin_cache()
+        response = await client.get("/api/admin/me", headers=headers)
+        assert response.status_code == 401
+
     @pytest.mark.unit
     async def test_get_current_admin_info_unauthorized(self, client: AsyncClient):
         """Test getting admin info without authentication."""
@@ -147,6 +174,38 @@ class TestAdminRouter:
         response = await client.get("/api/admin/dashboard/stats")
         assert response.status_code == 401
 
+    @pytest.mark.unit
+    async def test_get_dashboard_stats_not_modified(
+        self,
+        client: AsyncClient,
+        admin_user_in_db: AdminUser,
+        registration_in_db: Registration,
+    ):
+        """Test that a matching If-None-Match gets a 304 until the data changes."""
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await client.get("/api/admin/dashboard/stats", headers=headers)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = await client.get(
+            "/api/admin/dashboard/stats", headers={**headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
+        await client.put(
+            f"/api/admin/registrations/{registration_in_db.id}/status",
+            json={"status": "cancelled"},
+            headers=headers,
+        )
+        response = await client.get(
+            "/api/admin/dashboard/stats", headers={**headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
     @pytest.mark.unit
     async def test_list_registrations_success(
         self,
@@ -173,6 +232,135 @@ class TestAdminRouter:
         assert "status" in registration
         assert "class_id" in registration
 
+    @pytest.mark.unit
+    async def test_list_registrations_query_count_is_constant(
+        self,
+        client: AsyncClient,
+        admin_user_in_db: AdminUser,
+        registration_in_db: Registration,
+        db_session,
+    ):
+        """Test that listing registrations does not issue a query per row."""
+        from sqlalchemy import event
+
+        for i in range(5):
+            db_session.add(Registration(
+                name=f"User {i}",
+                email=f"user{i}@example.com",
+                class_id=registration_in_db.class_id,
+                status="confirmed",
+                preferred_language="en",
+            ))
+        await db_session.commit()
+
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        statements = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        sync_engine = db_session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", count_statement)
+        try:
+            response = await client.get("/api/admin/registrations", headers=headers)
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", count_statement)
+
+        assert response.status_code == 200
+        assert len(response.json()) == 6
+        # Admin lookup, registrations, and one batched payment load
+        assert len(statements) <= 3
+
+    @pytest.mark.unit
+    async def test_list_registrations_keyset_pagination(
+        self,
+        client: AsyncClient,
+        admin_user_in_db: AdminUser,
+        registration_in_db: Registration,
+        db_session,
+    ):
+        """Test paging through registrations with the next-cursor header."""
+        for i in range(4):
+            db_session.add(Registration(
+                name=f"User {i}",
+                email=f"user{i}@example.com",
+                class_id=registration_in_db.class_id,
+                status="confirmed",
+                preferred_language="en",
+            ))
+        await db_session.commit()
+
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        seen = []
+        params = {"limit": 2}
+        for _ in range(3):
+            response = await client.get("/api/admin/registrations", headers=headers, params=params)
+            assert response.status_code == 200
+            seen.extend(r["id"] for r in response.json())
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if next_cursor is None:
+                break
+            params = {"limit": 2, "cursor": next_cursor}
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+    @pytest.mark.unit
+    async def test_list_registrations_unpaged_by_default(
+        self,
+        client: AsyncClient,
+        admin_user_in_db: AdminUser,
+        registration_in_db: Registration,
+        db_session,
+    ):
+        """Test that callers passing no limit get every registration."""
+        for i in range(100):
+            db_session.add(Registration(
+                name=f"User {i}",
+                email=f"user{i}@example.com",
+                class_id=registration_in_db.class_id,
+                status="confirmed",
+                preferred_language="en",
+            ))
+        await db_session.commit()
+
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        response = await client.get(
+            "/api/admin/registrations",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == 200
+        assert len(response.json()) == 101
+        assert "X-Next-Cursor" not in response.headers
+
+    @pytest.mark.unit
+    async def test_list_registrations_not_modified(
+        self,
+        client: AsyncClient,
+        admin_user_in_db: AdminUser,
+        registration_in_db: Registration,
+    ):
+        """Test that an unchanged registration page is answered with a 304."""
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await client.get("/api/admin/registrations", headers=headers, params={"limit": 1})
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        next_cursor = response.headers["X-Next-Cursor"]
+
+        response = await client.get(
+            "/api/admin/registrations",
+            headers={**headers, "If-None-Match": etag},
+            params={"limit": 1},
+        )
+        assert response.status_code == 304
+        assert response.headers["X-Next-Cursor"] == next_cursor
+
     @pytest.mark.unit
     async def test_list_registrations_unauthorized(self, client: AsyncClient):
         """Test listing registrations without authentication."""
@@ -201,6 +389,40 @@ class TestAdminRouter:
         assert data["name"] == registration_in_db.name
         assert data["email"] == registration_in_db.email
 
+    @pytest.mark.unit
+    async def test_get_registration_loads_payment_in_one_statement(
+        self,
+        client: AsyncClient,
+        admin_user_in_db: AdminUser,
+        registration_in_db: Registration,
+        db_session,
+    ):
+        """Test that a single registration is read together with its payment."""
+        from sqlalchemy import event
+
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        statements = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        sync_engine = db_session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", count_statement)
+        try:
+            response = await client.get(
+                f"/api/admin/registrations/{registration_in_db.id}",
+                headers=headers
+            )
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", count_statement)
+
+        assert response.status_code == 200
+        registration_statements = [s for s in statements if "registrations" in s or "payments" in s]
+        assert len(registration_statements) == 1
+        assert "JOIN payments" in registration_statements[0]
+
     @pytest.mark.unit
     async def test_get_registration_not_found(
         self,
@@ -318,6 +540,65 @@ class TestAdminRouter:
 
         assert response.status_code == 401
 
+    @pytest.mark.unit
+    async def test_bulk_update_registration_status(
+        self,
+        client: AsyncClient,
+        admin_user_in_db: AdminUser,
+        registration_in_db: Registration,
+    ):
+        """Test updating several registrations in one request."""
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        update_data = {
+            "ids": [str(registration_in_db.id), str(uuid.uuid4())],
+            "status": "cancelled",
+        }
+
+        response = await client.put(
+            "/api/admin/registrations/bulk-status",
+            json=update_data,
+            headers=headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["updated"] == [str(registration_in_db.id)]
+
+        response = await client.get(
+            f"/api/admin/registrations/{registration_in_db.id}",
+            headers=headers
+        )
+        assert response.json()["status"] == "cancelled"
+
+    @pytest.mark.unit
+    async def test_bulk_update_registration_status_validation(
+        self,
+        client: AsyncClient,
+        admin_user_in_db: AdminUser,
+        registration_in_db: Registration,
+    ):
+        """Test bulk status update rejects bad statuses and oversized batches."""
+        from app.schemas.admin import BULK_STATUS_MAX_IDS
+
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await client.put(
+            "/api/admin/registrations/bulk-status",
+            json={"ids": [str(registration_in_db.id)], "status": "invalid_status"},
+            headers=headers
+        )
+        assert response.status_code == 400
+
+        too_many = [str(uuid.uuid4()) for _ in range(BULK_STATUS_MAX_IDS + 1)]
+        response = await client.put(
+            "/api/admin/registrations/bulk-status",
+            json={"ids": too_many, "status": "confirmed"},
+            headers=headers
+        )
+        assert response.status_code == 422
+
     @pytest.mark.unit
     async def test_admin_login_inactive_user(
         self,
@@ -412,6 +693,130 @@ class TestAdminRouter:
         assert data["total_teachers"] >= 1
         assert data["total_classes"] >= 1
 
+    @pytest.mark.unit
+    async def test_dashboard_stats_uses_entity_counters(
+        self,
+        client: AsyncClient,
+        admin_user_in_db: AdminUser,
+        registration_in_db: Registration,
+        db_session,
+    ):
+        """Test that seeded entity counters are read and kept current on insert."""
+        from app.models.entity_counter import EntityCounter
+
+        db_session.add_all([
+            EntityCounter(name="registrations", value=40),
+            EntityCounter(name="teachers", value=7),
+        ])
+        await db_session.commit()
+
+        db_session.add(Registration(
+            name="Counted User",
+            email="counted@example.com",
+            class_id=registration_in_db.class_id,
+            status="confirmed",
+            preferred_language="en",
+        ))
+        await db_session.commit()
+
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await client.get("/api/admin/dashboard/stats", headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_registrations"] == 41
+        assert data["total_teachers"] == 7
+        # No counter row for classes, so it falls back to counting
+        assert data["total_classes"] == 1
+
+    @pytest.mark.unit
+    async def test_dashboard_overview_is_one_statement(
+        self,
+        client: AsyncClient,
+        admin_user_in_db: AdminUser,
+        registration_in_db: Registration,
+        db_session,
+    ):
+        """Test that counts, payment stats and recent registrations are read in one statement."""
+        from sqlalchemy import event
+
+        for i in range(6):
+            db_session.add(Registration(
+                name=f"User {i}",
+                email=f"user{i}@example.com",
+                class_id=registration_in_db.class_id,
+                status="confirmed",
+                preferred_language="en",
+            ))
+        await db_session.commit()
+
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        statements = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        sync_engine = db_session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", count_statement)
+        try:
+            response = await client.get("/api/admin/dashboard/stats", headers=headers)
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", count_statement)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_registrations"] == 7
+        assert len(data["recent_registrations"]) == 5
+        assert len([s for s in statements if "registrations" in s or "payments" in s]) == 1
+
+    @pytest.mark.unit
+    async def test_dashboard_stats_are_cached_until_orm_write(
+        self,
+        client: AsyncClient,
+        admin_user_in_db: AdminUser,
+        registration_in_db: Registration,
+        db_session,
+    ):
+        """Test that stats are served from cache and dropped on ORM writes."""
+        from sqlalchemy import text
+
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await client.get("/api/admin/dashboard/stats", headers=headers)
+        assert response.json()["total_registrations"] == 1
+
+        # A raw SQL insert bypasses the ORM events, so the cached payload is served
+        await db_session.execute(
+            text(
+                "INSERT INTO registrations (id, class_id, name, email, status, "
+                "email_confirmation_sent, reminder_sent, preferred_language, "
+                "email_notifications, sms_notifications) "
+                "VALUES (:id, :class_id, 'Raw', 'raw@example.com', 'confirmed', 0, 0, 'en', 1, 0)"
+            ),
+            {"id": uuid.uuid4().hex, "class_id": registration_in_db.class_id.hex},
+        )
+        await db_session.commit()
+
+        response = await client.get("/api/admin/dashboard/stats", headers=headers)
+        assert response.json()["total_registrations"] == 1
+
+        db_session.add(Registration(
+            name="ORM User",
+            email="orm@example.com",
+            class_id=registration_in_db.class_id,
+            status="confirmed",
+            preferred_language="en",
+        ))
+        await db_session.commit()
+
+        response = await client.get("/api/admin/dashboard/stats", headers=headers)
+        assert response.json()["total_registrations"] == 3
+
     @pytest.mark.unit
     async def test_dashboard_stats_per_currency_revenue(
         self,
@@ -631,8 +1036,7 @@ class TestAdminRouter:
 
         # Verify structured schedule data was parsed and saved to database
         assert created_class.schedule_data is not None
-        import json
-        schedule_data = json.loads(created_class.schedule_data)
+        schedule_data = created_class.schedule_data
 
         assert schedule_data["type"] == "weekly_recurring"
         assert schedule_data["pattern"]["days"] == ["monday", "wednesday", "friday"]
@@ -687,8 +1091,7 @@ class TestAdminRouter:
         created_class = result.scalar_one()
 
         # Verify structured schedule data was parsed with correct duration
-        import json
-        schedule_data = json.loads(created_class.schedule_data)
+        schedule_data = created_class.schedule_data
 
         assert schedule_data["type"] == "weekly_recurring"
         assert schedule_data["pattern"]["days"] == ["wednesday"]
@@ -716,7 +1119,7 @@ class TestAdminRouter:
             teacher_id=teacher_in_db.id,
             yoga_type_id=yoga_type_in_db.id,
             schedule="Tue/Thu 6:00 PM",
-            schedule_data='{"type": "weekly_recurring"}',  # Original structured data
+            schedule_data={"type": "weekly_recurring"},  # Original structured data
             schedule_type="recurring",
             duration_minutes=75,
             difficulty="advanced",
@@ -767,8 +1170,7 @@ class TestAdminRouter:
         updated_class = result.scalar_one()
 
         # Verify structured schedule data was re-parsed
-        import json
-        schedule_data = json.loads(updated_class.schedule_data)
+        schedule_data = updated_class.schedule_data
 
         assert schedule_data["type"] == "weekly_recurring"
         assert schedule_data["pattern"]["days"] == ["monday"]
@@ -823,14 +1225,74 @@ class TestAdminRouter:
         created_class = result.scalar_one()
 
         # Verify structured schedule data was parsed correctly
-        import json
-        schedule_data = json.loads(created_class.schedule_data)
+        schedule_data = created_class.schedule_data
 
         assert schedule_data["type"] == "weekly_recurring"
         assert schedule_data["pattern"]["days"] == ["saturday", "sunday"]
         assert schedule_data["pattern"]["time"] == "19:30"
         assert schedule_data["pattern"]["duration_minutes"] == 60  # Default duration
 
+    @pytest.mark.unit
+    async def test_create_class_with_missing_references(
+        self,
+        client: AsyncClient,
+        admin_user_in_db: AdminUser,
+        teacher_in_db,
+        yoga_type_in_db,
+    ):
+        """Test that create_class rejects unknown teacher and yoga type ids."""
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        class_data = {
+            "name_en": "Test Class",
+            "name_zh": "测试课程",
+            "teacher_id": str(uuid.uuid4()),
+            "yoga_type_id": str(yoga_type_in_db.id),
+            "schedule": "Mon/Wed/Fri 7:00 AM",
+            "duration_minutes": 60,
+            "difficulty": "beginner",
+            "capacity": 20,
+        }
+
+        response = await client.post("/api/admin/classes", json=class_data, headers=headers)
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Teacher not found"
+
+        class_data["teacher_id"] = str(teacher_in_db.id)
+        class_data["yoga_type_id"] = str(uuid.uuid4())
+        response = await client.post("/api/admin/classes", json=class_data, headers=headers)
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Yoga type not found"
+
+    @pytest.mark.unit
+    async def test_update_teacher_keeps_omitted_photo_url(
+        self,
+        client: AsyncClient,
+        admin_user_in_db: AdminUser,
+        teacher_in_db,
+    ):
+        """Test that update_teacher only writes the fields the client sent."""
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+        original_photo_url = teacher_in_db.photo_url
+
+        update_data = {
+            "name_en": "Updated Teacher",
+            "name_zh": teacher_in_db.name_zh,
+            "bio_en": teacher_in_db.bio_en,
+            "bio_zh": teacher_in_db.bio_zh,
+            "qualifications": teacher_in_db.qualifications,
+        }
+
+        response = await client.put(
+            f"/api/admin/teachers/{teacher_in_db.id}", json=update_data, headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["name_en"] == "Updated Teacher"
+        assert data["photo_url"] == original_photo_url
+
     @pytest.mark.unit
     async def test_create_class_with_invalid_schedule_format(
         self,
@@ -1050,8 +1512,8 @@ class TestAdminRouter:
 
         assert admin_data["id"] == str(admin_user_in_db.id)
         assert admin_data["username"] == admin_user_in_db.username
-        assert admin_data["email"] == admin_user_in_db.email
         assert admin_data["role"] == admin_user_in_db.role
+        assert "email" not in admin_data
 
         # Verify admin_session cookie is a JWT token
         admin_session_cookie = cookies["admin_session"]
@@ -231,6 +231,43 @@ class TestAdminConsentRouter:
         assert response.status_code == 200
         assert len(response.json()) == 2
 
+    @pytest.mark.unit
+    async def test_list_consents_cursor_pagination(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        admin_user_in_db: AdminUser,
+        yoga_type_in_db: YogaType,
+    ):
+        """Test walking consent records with the X-Next-Cursor header."""
+        for i in range(5):
+            record = ConsentRecord(
+                email=f"cursor{i}@example.com",
+                name=f"User {i}",
+                yoga_type_id=yoga_type_in_db.id,
+                consent_text_version="1.0",
+            )
+            db_session.add(record)
+        await db_session.commit()
+
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+        seen = []
+        params = {"limit": 2}
+        while True:
+            response = await client.get(
+                "/api/admin/consent/consents", params=params, headers=headers
+            )
+            assert response.status_code == 200
+            seen.extend(item["id"] for item in response.json())
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if next_cursor is None:
+                break
+            params = {"limit": 2, "cursor": next_cursor}
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
     @pytest.mark.unit
     async def test_consent_stats_unauthorized(self, client: AsyncClient):
         """Test consent stats without auth returns 401."""
@@ -280,6 +317,39 @@ class TestAdminConsentRouter:
         assert data["total"] == 3
         assert len(data["by_yoga_type"]) >= 1
 
+    @pytest.mark.unit
+    async def test_consent_stats_refresh_after_new_consent(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        admin_user_in_db: AdminUser,
+        yoga_type_in_db: YogaType,
+    ):
+        """Test that cached consent stats are dropped when a consent is recorded."""
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await client.get("/api/admin/consent/stats", headers=headers)
+        assert response.json()["total"] == 0
+
+        db_session.add(ConsentRecord(
+            email="new@example.com",
+            name="New User",
+            yoga_type_id=yoga_type_in_db.id,
+            consent_text_version="1.0",
+        ))
+        await db_session.commit()
+
+        response = await client.get("/api/admin/consent/stats", headers=headers)
+        data = response.json()
+        assert data["total"] == 1
+        assert data["by_yoga_type"] == [{
+            "yoga_type_id": str(yoga_type_in_db.id),
+            "name_en": yoga_type_in_db.name_en,
+            "name_zh": yoga_type_in_db.name_zh,
+            "count": 1,
+        }]
+
     @pytest.mark.unit
     async def test_consent_stats_with_expired_token(
         self, client: AsyncClient, expired_jwt_token: str
@@ -1,7 +1,8 @@
 """Unit tests for payment router endpoints."""
 import uuid
 from datetime import datetime
-from unittest.mock import patch
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
 import pytest
 import pytest_asyncio
@@ -9,6 +10,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import create_access_token
+from app.config import settings
 from app.models.admin_user import AdminUser
 from app.models.class_package import ClassPackage
 from app.models.payment import Payment
@@ -210,6 +212,27 @@ class TestPublicPaymentSettings:
         response = await client.get("/api/payments/settings")
         assert response.status_code == 404
 
+    @pytest.mark.unit
+    async def test_get_settings_refreshed_after_admin_update(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        payment_settings_in_db: PaymentSettings,
+    ):
+        """Should serve the new instructions once an admin edits the cached settings."""
+        response = await client.get("/api/payments/settings")
+        assert response.json()["payment_instructions_en"] == "Pay via WeChat"
+
+        response = await client.put(
+            "/api/admin/payment-settings",
+            headers=auth_headers,
+            json={"payment_instructions_en": "Scan to pay"},
+        )
+        assert response.status_code == 200
+
+        response = await client.get("/api/payments/settings")
+        assert response.json()["payment_instructions_en"] == "Scan to pay"
+
 
 class TestPublicPaymentByRegistration:
     """Tests for GET /api/payments/registration/{registration_id}."""
@@ -278,6 +301,18 @@ class TestAdminListPayments:
         assert len(data) == 1
         assert data[0]["status"] == "confirmed"
 
+    @pytest.mark.unit
+    async def test_list_payments_rejects_unknown_status(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+    ):
+        """Unknown status filters should be rejected before querying."""
+        response = await client.get(
+            "/api/admin/payments?status=bogus", headers=auth_headers
+        )
+        assert response.status_code == 422
+
 
 class TestAdminPendingPayments:
     """Tests for GET /api/admin/payments/pending."""
@@ -411,6 +446,30 @@ class TestAdminConfirmPayment:
         assert data["status"] == "confirmed"
         assert data["payment_method"] == "venmo_qr"
 
+    @pytest.mark.unit
+    async def test_confirm_payment_emails_registrant(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        wechat_payment: Payment,
+        registration_in_db: Registration,
+    ):
+        """Should send the payment confirmed email as a background task."""
+        with patch(
+            "app.routers.payments.NotificationService.send_payment_confirmed_email",
+            new_callable=AsyncMock,
+        ) as mock_email:
+            response = await client.post(
+                f"/api/admin/payments/{wechat_payment.id}/confirm",
+                headers=auth_headers,
+                json={},
+            )
+        assert response.status_code == 200
+        mock_email.assert_awaited_once()
+        registration, payment = mock_email.await_args.args[:2]
+        assert registration.id == registration_in_db.id
+        assert payment.id == wechat_payment.id
+
     @pytest.mark.unit
     async def test_confirm_payment_not_found(
         self,
@@ -618,7 +677,7 @@ class TestAdminPaymentSettings:
         response = await client.post(
             "/api/admin/payment-settings/qr-code",
             headers=auth_headers,
-            files={"file": ("test.png", b"fake image data", "image/png")},
+            files={"file": ("test.png", b"\x89PNG\r\n\x1a\nfake image data", "image/png")},
         )
         assert response.status_code == 200
         data = response.json()
@@ -635,7 +694,7 @@ class TestAdminPaymentSettings:
         response = await client.post(
             "/api/admin/payment-settings/venmo-qr-code",
             headers=auth_headers,
-            files={"file": ("venmo.png", b"fake venmo qr", "image/png")},
+            files={"file": ("venmo.png", b"\x89PNG\r\n\x1a\nfake venmo qr", "image/png")},
         )
         assert response.status_code == 200
         data = response.json()
@@ -672,6 +731,28 @@ class TestAdminPaymentSettings:
         assert response.status_code == 400
         assert "image" in response.json()["detail"].lower()
 
+    @pytest.mark.unit
+    async def test_upload_qr_uses_sniffed_extension(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+    ):
+        """Should name the stored file after its content, not the client filename or type."""
+        response = await client.post(
+            "/api/admin/payment-settings/qr-code",
+            headers=auth_headers,
+            files={"file": ("qr.html", b"\xff\xd8\xff\xe0fake jpeg", "text/html")},
+        )
+        assert response.status_code == 200
+        assert response.json()["qr_code_url"].endswith(".jpg")
+
+        response = await client.post(
+            "/api/admin/payment-settings/qr-code",
+            headers=auth_headers,
+            files={"file": ("qr.png", b"<script>alert(1)</script>", "image/png")},
+        )
+        assert response.status_code == 400
+
     @pytest.mark.unit
     async def test_upload_qr_requires_auth(self, client: AsyncClient):
         """QR upload endpoints should require authentication."""
@@ -686,3 +767,22 @@ class TestAdminPaymentSettings:
             files={"file": ("test.png", b"data", "image/png")},
         )
         assert response.status_code == 401
+
+    @pytest.mark.unit
+    async def test_upload_qr_writes_uploaded_bytes(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        tmp_path: Path,
+    ):
+        """Should store the uploaded bytes unchanged under the payment upload dir."""
+        content = b"\x89PNG\r\n\x1a\n" + b"\x00" * 2048
+        with patch.object(settings, "upload_dir", str(tmp_path)):
+            response = await client.post(
+                "/api/admin/payment-settings/qr-code",
+                headers=auth_headers,
+                files={"file": ("qr.png", content, "image/png")},
+            )
+        assert response.status_code == 200
+        filename = response.json()["qr_code_url"].rsplit("/", 1)[-1]
+        assert (tmp_path / "payment" / filename).read_bytes() == content
@@ -1,5 +1,4 @@
 """Unit tests for registrations router."""
-import json
 import uuid
 from datetime import date, time
 from unittest.mock import patch
@@ -95,7 +94,7 @@ class TestRegistrationsRouter:
             "timezone": "UTC",
             "original_schedule": "Mon/Wed/Fri 7:00 AM",
         }
-        yoga_class_in_db.schedule_data = json.dumps(schedule_data)
+        yoga_class_in_db.schedule_data = schedule_data
 
         registration_data = {
             "name": "John Doe",
@@ -138,7 +137,7 @@ class TestRegistrationsRouter:
             "timezone": "UTC",
             "original_schedule": "Mon/Wed/Fri 7:00 AM",
         }
-        yoga_class_in_db.schedule_data = json.dumps(schedule_data)
+        yoga_class_in_db.schedule_data = schedule_data
 
         registration_data = {
             "name": "John Doe",
@@ -176,7 +175,7 @@ class TestRegistrationsRouter:
             "exceptions": [],
             "timezone": "UTC",
         }
-        yoga_class_in_db.schedule_data = json.dumps(schedule_data)
+        yoga_class_in_db.schedule_data = schedule_data
         await db_session.commit()
 
         registration_data = {
@@ -218,7 +217,7 @@ class TestRegistrationsRouter:
             "exceptions": [],
             "timezone": "UTC",
         }
-        yoga_class_in_db.schedule_data = json.dumps(schedule_data)
+        yoga_class_in_db.schedule_data = schedule_data
         await db_session.commit()
 
         registration_data = {
@@ -264,7 +263,7 @@ class TestRegistrationsRouter:
             "timezone": "UTC",
             "original_schedule": "Mon/Wed/Fri 7:00 AM",
         }
-        yoga_class_in_db.schedule_data = json.dumps(schedule_data)
+        yoga_class_in_db.schedule_data = schedule_data
         await db_session.commit()
 
         response = await client.get(f"/api/registrations/classes/{yoga_class_in_db.id}/available-dates")
@@ -394,7 +393,7 @@ class TestRegistrationsRouter:
             "exceptions": [],
             "timezone": "UTC",
         }
-        yoga_class_in_db.schedule_data = json.dumps(schedule_data)
+        yoga_class_in_db.schedule_data = schedule_data
         await db_session.commit()
 
         # First registration should be confirmed
@@ -454,7 +453,7 @@ class TestRegistrationsRouter:
             "exceptions": [],
             "timezone": "UTC",
         }
-        yoga_class_in_db.schedule_data = json.dumps(schedule_data)
+        yoga_class_in_db.schedule_data = schedule_data
         await db_session.commit()
 
         # Create 2 confirmed registrations for a specific date
@@ -210,6 +210,35 @@ class TestGetRegistrationsByToken:
         assert data["total"] == 2
         assert len(data["registrations"]) == 2
 
+    @pytest.mark.unit
+    async def test_registration_email_case_is_ignored(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        yoga_class_in_db: YogaClass,
+    ):
+        """Test registrations entered with mixed-case emails are still found."""
+        reg = Registration(
+            name="Case User",
+            email="  Case.User@Example.COM ",
+            phone="+1234567890",
+            class_id=yoga_class_in_db.id,
+            target_date=date(2026, 3, 15),
+            target_time=time(7, 0),
+            status="confirmed",
+            preferred_language="en",
+        )
+        db_session.add(reg)
+        token = TrackingToken(email="CASE.USER@example.com", token="h" * 64)
+        db_session.add(token)
+        await db_session.commit()
+
+        assert reg.email == "case.user@example.com"
+
+        response = await client.get(f"/api/track/{'h' * 64}")
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+
 
 class TestRequestTrackingLink:
     """Test cases for POST /api/track/request-link."""
@@ -218,10 +247,9 @@ class TestRequestTrackingLink:
     async def test_request_link_always_returns_200(self, client: AsyncClient):
         """Test that request-link always returns 200 (anti-enumeration)."""
         with patch(
-            "app.routers.tracking.NotificationService"
-        ) as MockNotification:
-            mock_instance = MockNotification.return_value
-            mock_instance.send_tracking_link_email = AsyncMock()
+            "app.routers.tracking._NOTIFICATION_SERVICE"
+        ) as mock_notification:
+            mock_notification.send_tracking_link_email = AsyncMock()
 
             response = await client.post(
                 "/api/track/request-link",
@@ -233,10 +261,9 @@ class TestRequestTrackingLink:
     async def test_request_link_response_message(self, client: AsyncClient):
         """Test response message does not reveal whether email exists."""
         with patch(
-            "app.routers.tracking.NotificationService"
-        ) as MockNotification:
-            mock_instance = MockNotification.return_value
-            mock_instance.send_tracking_link_email = AsyncMock()
+            "app.routers.tracking._NOTIFICATION_SERVICE"
+        ) as mock_notification:
+            mock_notification.send_tracking_link_email = AsyncMock()
 
             response = await client.post(
                 "/api/track/request-link",
@@ -253,10 +280,9 @@ class TestRequestTrackingLink:
     ):
         """Test that request-link creates a tracking token."""
         with patch(
-            "app.routers.tracking.NotificationService"
-        ) as MockNotification:
-            mock_instance = MockNotification.return_value
-            mock_instance.send_tracking_link_email = AsyncMock()
+            "app.routers.tracking._NOTIFICATION_SERVICE"
+        ) as mock_notification:
+            mock_notification.send_tracking_link_email = AsyncMock()
 
             response = await client.post(
                 "/api/track/request-link",
@@ -268,10 +294,9 @@ class TestRequestTrackingLink:
     async def test_request_link_default_language(self, client: AsyncClient):
         """Test that preferred_language defaults to 'en'."""
         with patch(
-            "app.routers.tracking.NotificationService"
-        ) as MockNotification:
-            mock_instance = MockNotification.return_value
-            mock_instance.send_tracking_link_email = AsyncMock()
+            "app.routers.tracking._NOTIFICATION_SERVICE"
+        ) as mock_notification:
+            mock_notification.send_tracking_link_email = AsyncMock()
 
             response = await client.post(
                 "/api/track/request-link",
@@ -292,10 +317,9 @@ class TestRequestTrackingLink:
     async def test_request_link_zh_language(self, client: AsyncClient):
         """Test request-link with Chinese language preference."""
         with patch(
-            "app.routers.tracking.NotificationService"
-        ) as MockNotification:
-            mock_instance = MockNotification.return_value
-            mock_instance.send_tracking_link_email = AsyncMock()
+            "app.routers.tracking._NOTIFICATION_SERVICE"
+        ) as mock_notification:
+            mock_notification.send_tracking_link_email = AsyncMock()
 
             response = await client.post(
                 "/api/track/request-link",
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.contact_inquiry import ContactInquiry
 from app.models.notification_template import NotificationTemplate
 from app.models.registration import Registration
 from app.services.notification_service import NotificationService
@@ -344,6 +345,34 @@ class TestNotificationService:
 
         assert count == 1  # Still only one template
 
+    @pytest.mark.unit
+    async def test_send_inquiry_notifications(
+        self,
+        db_session: AsyncSession,
+        mock_settings,
+    ):
+        """Test that a new inquiry emails both the user and the admin."""
+        service = NotificationService()
+        await service.create_default_templates(db_session)
+        inquiry = ContactInquiry(
+            name="Jane Doe",
+            email="jane@example.com",
+            subject="Class times",
+            message="When are the evening classes?",
+            category="scheduling",
+            preferred_language="en",
+        )
+
+        with patch.object(service, '_send_smtp_email') as mock_smtp:
+            mock_smtp.return_value = True
+
+            results = await service.send_inquiry_notifications(inquiry, db_session)
+
+            assert results == [True, True]
+            recipients = {call.kwargs["to_email"] for call in mock_smtp.call_args_list}
+            assert "jane@example.com" in recipients
+            assert len(recipients) == 2
+
     @pytest.mark.unit
     async def test_schedule_reminder_placeholder(self, registration_in_db: Registration):
         """Test schedule reminder placeholder functionality."""
@@ -2,6 +2,7 @@
 import uuid
 from datetime import datetime
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
@@ -293,6 +294,29 @@ class TestCreatePaymentForRegistration:
             )
 
 
+    @pytest.mark.unit
+    async def test_create_payment_retries_reference_collision(
+        self,
+        payment_service: PaymentService,
+        db_session: AsyncSession,
+        registration_in_db: Registration,
+        cny_class: YogaClass,
+    ):
+        """A reference number that is already taken should be redrawn."""
+        first = await payment_service.create_payment_for_registration(
+            registration_in_db, cny_class, db_session
+        )
+
+        refs = iter([first.reference_number, "EY-20260216-NEW1"])
+        with patch.object(payment_service, "generate_reference_number", side_effect=lambda: next(refs)):
+            second = await payment_service.create_payment_for_registration(
+                registration_in_db, cny_class, db_session
+            )
+
+        assert second.reference_number == "EY-20260216-NEW1"
+        assert first.reference_number != second.reference_number
+
+
 class TestConfirmPayment:
     """Tests for confirm_payment."""
 
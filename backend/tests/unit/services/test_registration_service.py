@@ -1,5 +1,4 @@
 """Unit tests for RegistrationService."""
-import json
 import uuid
 from datetime import date, time
 from unittest.mock import AsyncMock, patch
@@ -34,7 +33,7 @@ class TestRegistrationService:
             "timezone": "UTC",
             "original_schedule": "Mon/Wed/Fri 7:00 AM",
         }
-        yoga_class_in_db.schedule_data = json.dumps(schedule_data)
+        yoga_class_in_db.schedule_data = schedule_data
         await db_session.commit()
 
         registration_data = {
@@ -78,7 +77,7 @@ class TestRegistrationService:
             "timezone": "UTC",
             "original_schedule": "Mon/Wed/Fri 7:00 AM",
         }
-        yoga_class_in_db.schedule_data = json.dumps(schedule_data)
+        yoga_class_in_db.schedule_data = schedule_data
         await db_session.commit()
 
         registration_data = {
@@ -142,7 +141,7 @@ class TestRegistrationService:
             "timezone": "UTC",
             "original_schedule": "Mon/Wed/Fri 7:00 AM",
         }
-        yoga_class_in_db.schedule_data = json.dumps(schedule_data)
+        yoga_class_in_db.schedule_data = schedule_data
         await db_session.commit()
 
         target_date = date(2024, 3, 11)  # Monday
@@ -272,6 +271,38 @@ class TestRegistrationService:
         assert has_capacity is True
         assert current_count == 0
 
+    @pytest.mark.unit
+    async def test_get_registration_counts_for_dates(
+        self,
+        db_session: AsyncSession,
+        yoga_class_in_db: YogaClass,
+    ):
+        """Test counting registrations for several dates at once."""
+        monday, wednesday, friday = date(2024, 3, 11), date(2024, 3, 13), date(2024, 3, 15)
+        for i, (target_date, status) in enumerate([
+            (monday, "confirmed"),
+            (monday, "pending_payment"),
+            (wednesday, "waitlist"),
+            (wednesday, "cancelled"),
+        ]):
+            db_session.add(Registration(
+                name=f"User {i}",
+                email=f"user{i}@example.com",
+                class_id=yoga_class_in_db.id,
+                target_date=target_date,
+                status=status,
+                preferred_language="en",
+            ))
+        await db_session.commit()
+
+        service = RegistrationService()
+        counts = await service.get_registration_counts_for_dates(
+            yoga_class_in_db.id, [monday, wednesday, friday], db_session
+        )
+
+        # Cancelled registrations don't count and empty dates are omitted
+        assert counts == {monday: 2, wednesday: 1}
+
     @pytest.mark.unit
     async def test_get_registration_by_id(
         self,
@@ -396,7 +427,7 @@ class TestRegistrationService:
             "type": "weekly_recurring",
             "pattern": {"days": ["monday"], "time": "07:00"},
         }
-        yoga_class_in_db.schedule_data = json.dumps(schedule_data)
+        yoga_class_in_db.schedule_data = schedule_data
         await db_session.commit()
 
         service = RegistrationService()
@@ -412,7 +443,7 @@ class TestRegistrationService:
         db_session: AsyncSession,
         yoga_class_in_db: YogaClass,
     ):
-        """Test ensuring schedule data exists with invalid JSON."""
+        """Test ensuring schedule data exists when the stored value is not a schedule object."""
         yoga_class_in_db.schedule_data = "invalid json"
         yoga_class_in_db.schedule = "Mon/Wed/Fri 7:00 AM"
         await db_session.commit()
@@ -432,7 +463,7 @@ class TestRegistrationService:
 
             # Verify schedule_data was updated in database
             await db_session.refresh(yoga_class_in_db)
-            assert yoga_class_in_db.schedule_data == json.dumps(mock_parsed_schedule)
+            assert yoga_class_in_db.schedule_data == mock_parsed_schedule
 
     @pytest.mark.unit
     async def test_ensure_schedule_data_exists_with_none(
@@ -480,7 +511,7 @@ class TestRegistrationService:
         """Test creating registration without target date (for custom schedules)."""
         # Set up custom schedule
         schedule_data = {"type": "custom", "original_schedule": "By appointment"}
-        yoga_class_in_db.schedule_data = json.dumps(schedule_data)
+        yoga_class_in_db.schedule_data = schedule_data
         await db_session.commit()
 
         registration_data = {
@@ -517,7 +548,7 @@ class TestRegistrationService:
             "exceptions": [],
             "timezone": "UTC",
         }
-        yoga_class_in_db.schedule_data = json.dumps(schedule_data)
+        yoga_class_in_db.schedule_data = schedule_data
         await db_session.commit()
 
         registration_data = {
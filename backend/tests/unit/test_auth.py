@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.auth import (
     authenticate_admin,
     create_access_token,
+    encode_admin_subject,
     get_current_admin_bearer,
     get_password_hash,
     verify_password,
@@ -28,9 +29,9 @@ class TestAuthFunctions:
         password = "test_password_123"
         hashed = get_password_hash(password)
 
-        # Should return SHA256 hash (current implementation)
-        expected = hashlib.sha256(password.encode()).hexdigest()
-        assert hashed == expected
+        # Should return a salted bcrypt hash, not the plain password
+        assert hashed.startswith("$2")
+        assert password not in hashed
 
     @pytest.mark.unit
     def test_get_password_hash_different_inputs(self):
@@ -47,8 +48,8 @@ class TestAuthFunctions:
     def test_get_password_hash_empty_string(self):
         """Test hashing empty string."""
         hashed = get_password_hash("")
-        expected = hashlib.sha256("".encode()).hexdigest()
-        assert hashed == expected
+        assert hashed.startswith("$2")
+        assert verify_password("", hashed) is True
 
     @pytest.mark.unit
     def test_verify_password_correct(self):
@@ -74,6 +75,20 @@ class TestAuthFunctions:
         assert verify_password("", hashed) is True
         assert verify_password("not_empty", hashed) is False
 
+    @pytest.mark.unit
+    def test_verify_password_malformed_hash(self):
+        """Test that a stored hash which is not valid hex never verifies."""
+        assert verify_password("password", "not-a-hex-digest") is False
+        assert verify_password("password", "") is False
+
+    @pytest.mark.unit
+    def test_verify_password_legacy_sha256_hash(self):
+        """Test that legacy unsalted SHA-256 hashes still verify."""
+        legacy_hash = hashlib.sha256("legacy_password".encode()).hexdigest()
+
+        assert verify_password("legacy_password", legacy_hash) is True
+        assert verify_password("wrong_password", legacy_hash) is False
+
     @pytest.mark.unit
     def test_create_access_token_default_expiry(self):
         """Test JWT token creation with default expiry."""
@@ -146,6 +161,25 @@ class TestAuthFunctions:
         assert result.username == admin_user_in_db.username
         assert result.id == admin_user_in_db.id
 
+    @pytest.mark.unit
+    async def test_authenticate_admin_upgrades_legacy_hash(
+        self,
+        db_session: AsyncSession,
+        admin_user_in_db: AdminUser,
+    ):
+        """Test that a legacy SHA-256 hash is replaced by bcrypt on successful login."""
+        password = "test_password"
+        admin_user_in_db.hashed_password = hashlib.sha256(password.encode()).hexdigest()
+        await db_session.commit()
+
+        result = await authenticate_admin(
+            db_session, admin_user_in_db.username, password
+        )
+
+        assert result is not None
+        assert result.hashed_password.startswith("$2")
+        assert verify_password(password, result.hashed_password) is True
+
     @pytest.mark.unit
     async def test_authenticate_admin_wrong_password(
         self,
@@ -209,6 +243,21 @@ class TestAuthFunctions:
         assert result.username == admin_user_in_db.username
         assert result.id == admin_user_in_db.id
 
+    @pytest.mark.unit
+    async def test_get_current_admin_bearer_compact_subject(
+        self,
+        db_session: AsyncSession,
+        admin_user_in_db: AdminUser,
+    ):
+        """Test current admin retrieval with a base64url-encoded UUID subject."""
+        subject = encode_admin_subject(admin_user_in_db.id)
+        assert len(subject) == 22
+
+        token = create_access_token({"sub": subject})
+        result = await get_current_admin_bearer(token, db_session)
+
+        assert result.id == admin_user_in_db.id
+
     @pytest.mark.unit
     async def test_get_current_admin_bearer_invalid_token_format(self, db_session: AsyncSession):
         """Test current admin retrieval with invalid token format."""
@@ -291,14 +340,16 @@ class TestAuthFunctions:
             jwt.decode(token, "wrong_secret", algorithms=["HS256"])
 
     @pytest.mark.unit
-    def test_password_hash_consistency(self):
-        """Test that the same password always produces the same hash."""
+    def test_password_hash_is_salted(self):
+        """Test that the same password produces different hashes that both verify."""
         password = "consistent_password_123"
 
         hash1 = get_password_hash(password)
         hash2 = get_password_hash(password)
 
-        assert hash1 == hash2
+        assert hash1 != hash2
+        assert verify_password(password, hash1) is True
+        assert verify_password(password, hash2) is True
 
     @pytest.mark.unit
     def test_verify_password_case_sensitivity(self):
@@ -0,0 +1,158 @@
+"""Unit tests for the in-process response cache."""
+import uuid
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth import create_access_token
+from app.cache import TTLCache
+from app.models.admin_user import AdminUser
+from app.models.teacher import Teacher
+from app.models.yoga_class import YogaClass
+from app.routers.classes import _classes_cache
+from app.schemas.teacher import TeacherOut
+
+
+class TestTTLCache:
+    """Tests for TTLCache expiry and invalidation."""
+
+    @pytest.mark.unit
+    def test_entries_expire_after_ttl(self):
+        """Entries should be returned until their TTL has passed."""
+        cache = TTLCache(ttl_seconds=5)
+        with patch("app.cache.time.monotonic", return_value=100.0):
+            cache.set("key", "value")
+        with patch("app.cache.time.monotonic", return_value=104.9):
+            assert cache.get("key") == "value"
+        with patch("app.cache.time.monotonic", return_value=105.0):
+            assert cache.get("key") is None
+
+    @pytest.mark.unit
+    async def test_entries_are_dropped_on_commit_not_flush(
+        self,
+        db_session: AsyncSession,
+        teacher_in_db: Teacher,
+    ):
+        """A flushed write should only drop entries once its transaction commits."""
+        cache = TTLCache(ttl_seconds=60)
+        cache.clear_on_write(Teacher)
+        cache.set("key", "value")
+
+        teacher_in_db.name_en = "Renamed Teacher"
+        await db_session.flush()
+        assert cache.get("key") == "value"
+
+        await db_session.commit()
+        assert cache.get("key") is None
+
+    @pytest.mark.unit
+    async def test_entries_survive_rolled_back_write(
+        self,
+        db_session: AsyncSession,
+        teacher_in_db: Teacher,
+    ):
+        """A write that is rolled back should not drop entries at a later commit."""
+        cache = TTLCache(ttl_seconds=60)
+        cache.clear_on_write(Teacher)
+        cache.set("key", "value")
+
+        teacher_in_db.name_en = "Renamed Teacher"
+        await db_session.flush()
+        await db_session.rollback()
+        await db_session.commit()
+
+        assert cache.get("key") == "value"
+
+    @pytest.mark.unit
+    async def test_teacher_list_is_refreshed_after_write(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        teacher_in_db: Teacher,
+    ):
+        """Writing a teacher through the ORM should drop the cached list."""
+        response = await client.get("/api/teachers")
+        assert [t["name_en"] for t in response.json()] == [teacher_in_db.name_en]
+
+        teacher_in_db.name_en = "Renamed Teacher"
+        await db_session.commit()
+
+        response = await client.get("/api/teachers")
+        assert [t["name_en"] for t in response.json()] == ["Renamed Teacher"]
+
+    @pytest.mark.unit
+    async def test_teacher_detail_is_refreshed_after_bulk_update(
+        self,
+        client: AsyncClient,
+        admin_user_in_db: AdminUser,
+        teacher_in_db: Teacher,
+    ):
+        """ORM UPDATE statements bypass flush events but should still drop the cache."""
+        response = await client.get(f"/api/teachers/{teacher_in_db.id}")
+        assert response.json()["name_en"] == teacher_in_db.name_en
+
+        token = create_access_token({"sub": str(admin_user_in_db.id)})
+        update_data = TeacherOut.model_validate(teacher_in_db).model_dump(mode="json")
+        update_data["name_en"] = "Updated Teacher"
+        response = await client.put(
+            f"/api/admin/teachers/{teacher_in_db.id}",
+            json=update_data,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == 200
+
+        response = await client.get(f"/api/teachers/{teacher_in_db.id}")
+        assert response.json()["name_en"] == "Updated Teacher"
+
+    @pytest.mark.unit
+    async def test_class_list_is_refreshed_after_embedded_teacher_write(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        yoga_class_in_db: YogaClass,
+        teacher_in_db: Teacher,
+    ):
+        """Class listings embed their teacher, so a teacher write should drop them too."""
+        response = await client.get("/api/classes")
+        assert [c["teacher"]["name_en"] for c in response.json()] == [teacher_in_db.name_en]
+
+        teacher_in_db.name_en = "Renamed Teacher"
+        await db_session.commit()
+
+        response = await client.get("/api/classes")
+        assert [c["teacher"]["name_en"] for c in response.json()] == ["Renamed Teacher"]
+
+    @pytest.mark.unit
+    async def test_class_list_answers_matching_etag_with_304(
+        self,
+        client: AsyncClient,
+        yoga_class_in_db: YogaClass,
+    ):
+        """A client revalidating an unchanged class list should get an empty 304."""
+        response = await client.get("/api/classes")
+        assert response.headers["Cache-Control"] == "public, no-cache"
+        etag = response.headers["ETag"]
+
+        response = await client.get("/api/classes", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    @pytest.mark.unit
+    async def test_classes_by_unknown_teacher_are_not_cached(
+        self,
+        client: AsyncClient,
+        teacher_in_db: Teacher,
+        yoga_class_in_db: YogaClass,
+    ):
+        """Only existing teachers should get a cache entry; arbitrary ids from the URL must not."""
+        for _ in range(3):
+            response = await client.get(f"/api/classes/teacher/{uuid.uuid4()}")
+            assert response.status_code == 200
+            assert response.json() == []
+        assert _classes_cache._entries == {}
+
+        response = await client.get(f"/api/classes/teacher/{teacher_in_db.id}")
+        assert len(response.json()) == 1
+        assert list(_classes_cache._entries) == [teacher_in_db.id]
@@ -0,0 +1,38 @@
+"""Unit tests for primary key generation."""
+import time
+
+import pytest
+
+from app.models.ids import uuid7
+
+
+class TestUuid7:
+    """Tests for time-ordered UUID generation."""
+
+    @pytest.mark.unit
+    def test_version_and_variant(self):
+        """Generated ids should be RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    @pytest.mark.unit
+    def test_embeds_current_timestamp(self):
+        """The leading 48 bits should hold the Unix time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after
+
+    @pytest.mark.unit
+    def test_ids_are_time_ordered(self):
+        """Ids generated in later milliseconds should sort after earlier ones."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        assert first < second
+
+    @pytest.mark.unit
+    def test_ids_are_unique(self):
+        """Ids generated within the same millisecond should still differ."""
+        assert len({uuid7() for _ in range(1000)}) == 1000
@@ -0,0 +1,124 @@
+"""Unit tests for streaming upload storage."""
+import io
+import uuid
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from httpx import AsyncClient
+
+from app.uploads import (
+    MAX_IMAGE_SIZE,
+    MULTIPART_OVERHEAD,
+    UPLOAD_CHUNK_SIZE,
+    save_upload,
+    save_upload_by_content,
+    sniff_image_extension,
+    unique_upload_name,
+)
+
+
+class TestSaveUpload:
+    """Tests for save_upload."""
+
+    @pytest.mark.unit
+    async def test_writes_all_chunks(self, tmp_path):
+        """Uploads larger than one chunk should be written in full."""
+        data = b"x" * (UPLOAD_CHUNK_SIZE * 2 + 10)
+        path = tmp_path / "photo.jpg"
+
+        written = await save_upload(UploadFile(file=io.BytesIO(data)), path, max_size=len(data))
+
+        assert written == len(data)
+        assert path.read_bytes() == data
+
+    @pytest.mark.unit
+    async def test_rejects_oversized_upload_and_removes_partial_file(self, tmp_path):
+        """The size limit should apply to bytes received, not the declared size."""
+        data = b"x" * (UPLOAD_CHUNK_SIZE + 1)
+        path = tmp_path / "photo.jpg"
+
+        with pytest.raises(HTTPException) as exc_info:
+            await save_upload(UploadFile(file=io.BytesIO(data)), path, max_size=UPLOAD_CHUNK_SIZE)
+
+        assert exc_info.value.status_code == 400
+        assert not path.exists()
+
+
+class TestSaveUploadByContent:
+    """Tests for save_upload_by_content."""
+
+    @pytest.mark.unit
+    async def test_identical_uploads_share_one_file(self, tmp_path):
+        """The same bytes uploaded twice should map to one stored file."""
+        data = b"\x89PNG\r\n\x1a\n" + b"x" * 100
+
+        first = await save_upload_by_content(UploadFile(file=io.BytesIO(data)), tmp_path, "png", len(data))
+        second = await save_upload_by_content(UploadFile(file=io.BytesIO(data)), tmp_path, "png", len(data))
+        other = await save_upload_by_content(UploadFile(file=io.BytesIO(data + b"y")), tmp_path, "png", len(data) + 1)
+
+        assert first == second != other
+        assert first.endswith(".png")
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted([first, other])
+        assert (tmp_path / first).read_bytes() == data
+
+
+class TestSniffImageExtension:
+    """Tests for magic-byte image detection."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("header, extension", [
+        (b"\xff\xd8\xff\xe0" + b"\x00" * 8, "jpg"),
+        (b"\x89PNG\r\n\x1a\n" + b"\x00" * 4, "png"),
+        (b"GIF89a" + b"\x00" * 6, "gif"),
+        (b"RIFF\x00\x00\x00\x00WEBP", "webp"),
+    ])
+    async def test_detects_image_formats(self, header, extension):
+        """Known signatures should map to their extension and leave the file rewound."""
+        upload = UploadFile(file=io.BytesIO(header + b"rest"), filename="photo.exe")
+
+        assert await sniff_image_extension(upload) == extension
+        assert await upload.read() == header + b"rest"
+
+    @pytest.mark.unit
+    async def test_rejects_non_images(self):
+        """Content that is not an image should be rejected whatever its name."""
+        upload = UploadFile(file=io.BytesIO(b"%PDF-1.7 fake"), filename="photo.png")
+
+        assert await sniff_image_extension(upload) is None
+
+
+class TestUniqueUploadName:
+    """Tests for unique_upload_name."""
+
+    @pytest.mark.unit
+    def test_names_are_prefixed_and_distinct(self):
+        """Each call should keep the prefix and extension but use a fresh token."""
+        first = unique_upload_name("teacher", "png")
+        second = unique_upload_name("teacher", "png")
+
+        assert first.startswith("teacher_") and first.endswith(".png")
+        assert first != second
+
+
+class TestUploadSizeLimitMiddleware:
+    """Tests for the Content-Length check in front of the image upload endpoints."""
+
+    @pytest.mark.unit
+    async def test_rejects_oversized_upload_before_reading_body(self, client: AsyncClient):
+        """A declared body over the limit should get a 413 before auth or parsing run."""
+        response = await client.post(
+            f"/api/admin/teachers/{uuid.uuid4()}/photo",
+            files={"file": ("photo.jpg", b"\xff\xd8\xff" + b"x" * (MAX_IMAGE_SIZE + MULTIPART_OVERHEAD), "image/jpeg")},
+        )
+
+        assert response.status_code == 413
+
+    @pytest.mark.unit
+    async def test_small_upload_reaches_the_endpoint(self, client: AsyncClient):
+        """Uploads under the limit should pass through to the route."""
+        response = await client.post(
+            f"/api/admin/teachers/{uuid.uuid4()}/photo",
+            files={"file": ("photo.jpg", b"\xff\xd8\xff", "image/jpeg")},
+        )
+
+        assert response.status_code != 413